@@ -11,8 +11,9 @@ Supported Clouds:
 - BigQuery: BigLake external tables
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 from enum import Enum
 
 
@@ -65,6 +66,13 @@ class Bridge:
         """
         self.provider = CloudProvider(provider.lower())
         self.credentials = credentials
+        # Resolve the provider's DDL builder once, not on every model
+        self._build_ddl = {
+            CloudProvider.SNOWFLAKE: self._snowflake_ddl,
+            CloudProvider.DATABRICKS: self._databricks_ddl,
+            CloudProvider.BIGQUERY: self._bigquery_ddl,
+            CloudProvider.ATHENA: self._athena_ddl,
+        }.get(self.provider)
     
     def construct_iceberg_ddl(
         self,
@@ -83,16 +91,9 @@ class Bridge:
         Returns:
             DDL statement that creates an Iceberg table
         """
-        if self.provider == CloudProvider.SNOWFLAKE:
-            return self._snowflake_ddl(sql, config, is_replace)
-        elif self.provider == CloudProvider.DATABRICKS:
-            return self._databricks_ddl(sql, config, is_replace)
-        elif self.provider == CloudProvider.BIGQUERY:
-            return self._bigquery_ddl(sql, config, is_replace)
-        elif self.provider == CloudProvider.ATHENA:
-            return self._athena_ddl(sql, config, is_replace)
-        else:
+        if self._build_ddl is None:
             raise ValueError(f"Unsupported cloud provider: {self.provider}")
+        return self._build_ddl(sql, config, is_replace)
     
     def _snowflake_ddl(
         self,
@@ -347,10 +348,41 @@ class CatalogRegistrar:
         if self.catalog is None:
             return False
         
+        return self._refresh_table_id(f"{schema}.{table}")
+    
+    def _refresh_table_id(self, table_id: str) -> bool:
         try:
-            table_id = f"{schema}.{table}"
             iceberg_table = self.catalog.load_table(table_id)
             iceberg_table.refresh()
             return True
         except Exception:
             return False
+    
+    def refresh_tables(
+        self,
+        tables: Iterable[Tuple[str, str]],
+        max_workers: int = 4,
+    ) -> Dict[str, bool]:
+        """
+        Refresh several tables' metadata concurrently.
+        
+        Tables that appear more than once are refreshed once. PyIceberg has
+        no multi-table refresh, so each table is still its own load_table()
+        round trip; up to max_workers of them run at the same time.
+        
+        Args:
+            tables: (schema, table) pairs
+            max_workers: Most refreshes in flight at once
+            
+        Returns:
+            Dict mapping "schema.table" to whether its refresh succeeded
+        """
+        table_ids = list(dict.fromkeys(f"{schema}.{table}" for schema, table in tables))
+        if not table_ids or self.catalog is None:
+            return dict.fromkeys(table_ids, False)
+        
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(table_ids)),
+            thread_name_prefix="icebreaker-catalog",
+        ) as pool:
+            return dict(zip(table_ids, pool.map(self._refresh_table_id, table_ids)))
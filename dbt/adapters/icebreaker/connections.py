@@ -7,7 +7,9 @@ Implements lazy initialization and dynamic engine switching.
 
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Literal, Optional
+import io
 import os
 
 # Auto-load .env file if it exists (no need to manually source .env)
@@ -35,6 +37,7 @@ def _load_env_file():
 _load_env_file()
 
 from dbt.adapters.icebreaker.console import console
+from dbt.adapters.icebreaker.errors import SnowflakeConnectionError
 
 import logging
 # Suppress noisy Snowflake connector retry warnings (transient network hiccups)
@@ -57,6 +60,63 @@ import re as regex_module
 EngineType = Literal["duckdb", "cloud"]
 
 
+@lru_cache(maxsize=1)
+def _aws_env() -> tuple:
+    """Read AWS credentials from the environment once per process.
+    
+    Env vars (including any loaded from .env above) don't change during a
+    dbt run, so every connection can share the same lookup.
+    """
+    return (
+        os.environ.get("AWS_ACCESS_KEY_ID"),
+        os.environ.get("AWS_SECRET_ACCESS_KEY"),
+        os.environ.get("AWS_REGION", "us-east-1"),
+    )
+
+
+# snowflake.connector.connect() kwarg -> environment variable
+_SF_FIELDS = (
+    ("account", "SNOWFLAKE_ACCOUNT"),
+    ("user", "SNOWFLAKE_USER"),
+    ("password", "SNOWFLAKE_PASSWORD"),
+    ("warehouse", "SNOWFLAKE_WAREHOUSE"),
+    ("database", "SNOWFLAKE_DATABASE"),
+    ("schema", "SNOWFLAKE_SCHEMA"),
+)
+
+
+@lru_cache(maxsize=1)
+def _snowflake_env() -> dict:
+    """Read the Snowflake connection env vars once per process.
+    
+    Returns connect() kwargs keyed by kwarg name (see _SF_FIELDS).
+    """
+    return {kwarg: os.environ.get(env_var) for kwarg, env_var in _SF_FIELDS}
+
+
+# snowflake.connector module, imported on first use (optional dependency)
+_snowflake_connector: Optional[Any] = None
+
+
+def _get_snowflake_connector() -> Any:
+    """Import snowflake.connector once and return the module."""
+    global _snowflake_connector
+    if _snowflake_connector is None:
+        try:
+            import snowflake.connector
+        except ImportError:
+            raise DbtRuntimeError(
+                "Snowflake connector not installed. Run: pip install dbt-icebreaker[snowflake]"
+            )
+        _snowflake_connector = snowflake.connector
+    return _snowflake_connector
+
+
+def _sql_string(value: str) -> str:
+    """Render a value as a single-quoted SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
 @dataclass
 class IcebreakerCredentials(Credentials):
     """Configuration for the Icebreaker adapter.
@@ -326,7 +386,7 @@ class IcebreakerConnectionManager(SQLConnectionManager):
             old_handle = connection.handle
             connection.handle = self._shared_cloud_handle
             if old_handle != self._shared_cloud_handle:
-                console.step(f"Executing on CLOUD: {sql[:80]}...")
+                console.step_lazy(lambda: f"Executing on CLOUD: {sql[:80]}...")
         elif self._shared_local_handle is not None:
             # Use local DuckDB handle
             connection.handle = self._shared_local_handle
@@ -453,7 +513,7 @@ class IcebreakerConnectionManager(SQLConnectionManager):
         
         object_name = match.group(1)  # DuckDB name, e.g. '_marts_obie.obie_claims'
         sf_object_name = self._resolve_snowflake_object_name(object_name)
-        console.step(f"Syncing {object_name} -> {sf_object_name}")
+        console.step_lazy(lambda: f"Syncing {object_name} -> {sf_object_name}")
         
         # Skip if already synced
         if object_name.lower() in self._synced_objects:
@@ -614,10 +674,9 @@ class IcebreakerConnectionManager(SQLConnectionManager):
             return sql
         
         try:
-            from dbt.adapters.icebreaker.transpiler import Transpiler
+            from dbt.adapters.icebreaker.transpiler import get_transpiler
             
-            transpiler = Transpiler(source_dialect="snowflake")
-            transpiled = transpiler.to_duckdb(sql)
+            transpiled = get_transpiler("snowflake").to_duckdb(sql)
             
             if transpiled and transpiled != sql:
                 # Log first time we transpile something
@@ -906,12 +965,7 @@ class IcebreakerConnectionManager(SQLConnectionManager):
                     console.warn(f"Could not attach MotherDuck to local: {e}")
             
             # Load extensions
-            for ext in credentials._duckdb_extensions:
-                try:
-                    cls._shared_cloud_handle.execute(f"INSTALL {ext}")
-                    cls._shared_cloud_handle.execute(f"LOAD {ext}")
-                except Exception as e:
-                    console.debug(f"Extension {ext} not available: {e}")
+            cls._load_extensions(cls._shared_cloud_handle, credentials._duckdb_extensions)
             
             return cls._shared_cloud_handle
         except Exception as e:
@@ -1054,6 +1108,43 @@ class IcebreakerConnectionManager(SQLConnectionManager):
             console.warn(f"Iceberg catalog connection failed: {e}")
             return False
     
+    @staticmethod
+    def _load_extensions(handle: duckdb.DuckDBPyConnection, extensions: list) -> None:
+        """Install and load DuckDB extensions, skipping any already present.
+        
+        Checks duckdb_extensions() first so extensions installed on disk are
+        not re-INSTALLed (which can hit the network), then sends the remaining
+        INSTALL/LOAD statements as a single script. If the batched script
+        fails, falls back to one extension at a time so a single unavailable
+        extension doesn't block the others.
+        """
+        try:
+            rows = handle.execute(
+                "SELECT extension_name, installed, loaded FROM duckdb_extensions()"
+            ).fetchall()
+            status = {name: (installed, loaded) for name, installed, loaded in rows}
+            
+            script = io.StringIO()
+            for ext in extensions:
+                installed, loaded = status.get(ext, (False, False))
+                if not installed:
+                    script.write(f"INSTALL {ext};\n")
+                if not loaded:
+                    script.write(f"LOAD {ext};\n")
+            
+            if script.tell():
+                handle.execute(script.getvalue())
+            return
+        except Exception as e:
+            console.debug(f"Batched extension load failed, loading individually: {e}")
+        
+        for ext in extensions:
+            try:
+                handle.execute(f"INSTALL {ext}")
+                handle.execute(f"LOAD {ext}")
+            except Exception as e:
+                console.debug(f"Extension {ext} not available: {e}")
+    
     # Thread lock for connection initialization
     import threading
     _connection_lock = threading.Lock()
@@ -1132,12 +1223,7 @@ class IcebreakerConnectionManager(SQLConnectionManager):
                     cls._sync_enabled = True  # Cross-db sync is available
                     
                     # Load extensions
-                    for ext in credentials._duckdb_extensions:
-                        try:
-                            cls._shared_cloud_handle.execute(f"INSTALL {ext}")
-                            cls._shared_cloud_handle.execute(f"LOAD {ext}")
-                        except Exception as e:
-                            console.debug(f"Extension {ext} not available: {e}")
+                    cls._load_extensions(cls._shared_cloud_handle, credentials._duckdb_extensions)
                     
                     connection.state = ConnectionState.OPEN
                     connection.handle = cls._shared_cloud_handle
@@ -1152,12 +1238,7 @@ class IcebreakerConnectionManager(SQLConnectionManager):
                 cls._shared_local_handle = duckdb.connect(":memory:")
                 cls._shared_local_handle.execute(f"SET threads = {credentials.threads}")
                 
-                for ext in credentials._duckdb_extensions:
-                    try:
-                        cls._shared_local_handle.execute(f"INSTALL {ext}")
-                        cls._shared_local_handle.execute(f"LOAD {ext}")
-                    except Exception as e:
-                        console.debug(f"Extension {ext} not available: {e}")
+                cls._load_extensions(cls._shared_local_handle, credentials._duckdb_extensions)
             
             connection.state = ConnectionState.OPEN
             connection.handle = cls._shared_local_handle
@@ -1218,13 +1299,7 @@ class IcebreakerConnectionManager(SQLConnectionManager):
             self._duckdb_conn.execute(f"SET threads = {credentials.threads}")
             
             # Load extensions
-            for ext in credentials._duckdb_extensions:
-                try:
-                    self._duckdb_conn.execute(f"INSTALL {ext}")
-                    self._duckdb_conn.execute(f"LOAD {ext}")
-                except Exception as e:
-                    # Extension might not be available, log and continue
-                    pass
+            self._load_extensions(self._duckdb_conn, credentials._duckdb_extensions)
             
             # Configure AWS credentials if available
             self._configure_aws()
@@ -1233,16 +1308,14 @@ class IcebreakerConnectionManager(SQLConnectionManager):
     
     def _configure_aws(self) -> None:
         """Configure AWS credentials for S3 access."""
-        aws_access_key = os.environ.get("AWS_ACCESS_KEY_ID")
-        aws_secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY")
-        aws_region = os.environ.get("AWS_REGION", "us-east-1")
+        aws_access_key, aws_secret_key, aws_region = _aws_env()
         
         if aws_access_key and aws_secret_key:
-            self._duckdb_conn.execute(f"""
-                SET s3_access_key_id = '{aws_access_key}';
-                SET s3_secret_access_key = '{aws_secret_key}';
-                SET s3_region = '{aws_region}';
-            """)
+            # One short statement per setting; values are escaped so quotes
+            # in secrets can't break (or inject into) the statement.
+            self._duckdb_conn.execute(f"SET s3_access_key_id = {_sql_string(aws_access_key)}")
+            self._duckdb_conn.execute(f"SET s3_secret_access_key = {_sql_string(aws_secret_key)}")
+            self._duckdb_conn.execute(f"SET s3_region = {_sql_string(aws_region)}")
     
     @property
     def cloud(self) -> Any:
@@ -1275,21 +1348,20 @@ class IcebreakerConnectionManager(SQLConnectionManager):
     
     def _open_snowflake(self, credentials: IcebreakerCredentials) -> Any:
         """Open Snowflake connection using standard env vars."""
-        try:
-            import snowflake.connector
-        except ImportError:
-            raise DbtRuntimeError(
-                "Snowflake connector not installed. Run: pip install dbt-icebreaker[snowflake]"
-            )
+        snowflake_connector = _get_snowflake_connector()
         
-        return snowflake.connector.connect(
-            account=credentials.cloud_bridge_account or os.environ.get("SNOWFLAKE_ACCOUNT"),
-            user=os.environ.get("SNOWFLAKE_USER"),
-            password=os.environ.get("SNOWFLAKE_PASSWORD"),
-            warehouse=os.environ.get("SNOWFLAKE_WAREHOUSE"),
-            database=os.environ.get("SNOWFLAKE_DATABASE"),
-            schema=os.environ.get("SNOWFLAKE_SCHEMA"),
-        )
+        connect_kwargs = dict(_snowflake_env())
+        connect_kwargs["account"] = credentials.cloud_bridge_account or connect_kwargs["account"]
+        
+        # Fail fast with an actionable error instead of the connector's generic one
+        missing = [
+            env_var for kwarg, env_var in _SF_FIELDS
+            if kwarg in ("account", "user") and not connect_kwargs[kwarg]
+        ]
+        if missing:
+            raise SnowflakeConnectionError("missing credentials", missing_env_vars=missing)
+        
+        return snowflake_connector.connect(**connect_kwargs)
     
     def _open_bigquery(self, credentials: IcebreakerCredentials) -> Any:
         """Stub for BigQuery connection."""
@@ -1313,6 +1385,18 @@ class IcebreakerConnectionManager(SQLConnectionManager):
         finally:
             self._active_engine = previous
     
+    def execute_many(self, sqls: list) -> Optional[AdapterResponse]:
+        """
+        Execute several statements as a single script.
+        
+        DuckDB runs multi-statement strings natively, so N DDLs cost one
+        execute call (one round-trip on MotherDuck) instead of N.
+        """
+        if not sqls:
+            return None
+        response, _ = self.execute(";\n".join(sqls))
+        return response
+    
     @classmethod
     def get_response(cls, cursor: Any) -> AdapterResponse:
         """Build response from cursor."""
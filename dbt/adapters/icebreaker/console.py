@@ -19,16 +19,19 @@ Usage:
         cursor.execute(query)
 """
 
+import copy
+import itertools
 import os
 import sys
 import threading
 import time
 from contextlib import contextmanager
-from typing import Optional
+from typing import Callable, Optional, Union
 
 from rich.console import Console as RichConsole
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from rich.theme import Theme
 
 
@@ -68,6 +71,21 @@ _THEME = Theme({
     "ib.muted": "dim italic",
 })
 
+# Pre-built line prefixes. Messages are appended as plain text, so Rich
+# never has to run its markup parser on a log line.
+_PFX_SUCCESS = Text.assemble("  ", ("✓", "ib.success"), " ")
+_PFX_WARN = Text.assemble("  ", ("!", "ib.warn"), " ")
+_PFX_ERROR = Text.assemble("  ", ("✗", "ib.error"), " ")
+_PFX_STEP = Text.assemble("  ", ("›", "ib.step"), " ")
+_PFX_INDENT = Text("  ")
+
+
+def _line(prefix: Text, msg: str, style: str = "") -> Text:
+    """Build an output line from a pre-built prefix and a plain message."""
+    line = prefix.copy()
+    line.append(msg, style=style)
+    return line
+
 
 # ---------------------------------------------------------------------------
 # Shared Spinner (thread-safe, supports multiple concurrent callers)
@@ -85,15 +103,29 @@ class _SharedSpinner:
     
     All print methods clear the spinner line before printing so that
     regular output and the spinner never garble each other.
+    
+    The animator only rebuilds its message when register()/unregister()
+    mark it dirty; otherwise each tick reuses the cached message.
     """
     
-    def __init__(self, print_lock: threading.Lock):
+    def __init__(self, print_lock: threading.Lock, raw_tty: bool = False):
         self._print_lock = print_lock
+        # Write straight to fd 1 on a TTY, skipping the buffered writer
+        self._raw_tty = raw_tty
         self._ops_lock = threading.Lock()
+        # Signals register()/unregister() to the animator; shares _ops_lock
+        self._cv = threading.Condition(self._ops_lock)
         self._active_ops: dict[int, str] = {}  # thread_id -> message
+        # Most recently registered op; refreshed lazily when that op finishes
+        self._latest_tid: Optional[int] = None
+        self._latest_msg = ""
         self._thread: Optional[threading.Thread] = None
         self._running = False
-        self._frame_idx = 0
+        self._frames = itertools.cycle(_SPIN_FRAMES)
+        self._frame = next(self._frames)
+        # Set whenever _active_ops changes; wakes the animator early
+        self._dirty = False
+        self._cached_msg = ""
         # Track the length of the last spinner line for clean clearing
         self._last_line_len = 0
     
@@ -101,58 +133,97 @@ class _SharedSpinner:
     def is_active(self) -> bool:
         return self._running
     
+    @property
+    def is_idle(self) -> bool:
+        """True when not animating and no spinner line is left on screen."""
+        return not self._running and self._last_line_len == 0
+    
     def register(self, message: str):
         """Register the calling thread with a spinner message."""
-        with self._ops_lock:
-            self._active_ops[threading.current_thread().ident] = message
+        tid = threading.current_thread().ident
+        with self._cv:
+            self._active_ops[tid] = message
+            self._latest_tid = tid
+            self._latest_msg = message
+            self._dirty = True
             if not self._running:
                 self._running = True
-                self._frame_idx = 0
+                self._frames = itertools.cycle(_SPIN_FRAMES)
+                self._frame = next(self._frames)
+            if self._thread is None:
+                # Started once and parked between spinner sessions
                 self._thread = threading.Thread(target=self._animate, daemon=True)
                 self._thread.start()
+            self._cv.notify()
     
     def unregister(self):
         """Unregister the calling thread. Spinner stops when all done."""
-        with self._ops_lock:
-            self._active_ops.pop(threading.current_thread().ident, None)
+        tid = threading.current_thread().ident
+        with self._cv:
+            self._active_ops.pop(tid, None)
+            if tid == self._latest_tid:
+                self._latest_tid = None
             if not self._active_ops:
                 self._running = False
+            self._dirty = True
+            self._cv.notify()
     
     def clear_line(self):
         """Clear the spinner line. Called by print methods WHILE HOLDING print_lock."""
         if self._last_line_len > 0:
-            sys.stdout.write('\r' + ' ' * self._last_line_len + '\r')
-            sys.stdout.flush()
+            self._write('\r' + ' ' * self._last_line_len + '\r')
             self._last_line_len = 0
     
+    def _write(self, text: str) -> None:
+        """Write spinner output. Called WHILE HOLDING print_lock."""
+        if self._raw_tty:
+            os.write(1, text.encode("utf-8"))
+        else:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+    
+    def _rebuild_message(self) -> None:
+        """Rebuild the cached spinner message. Caller must hold _ops_lock."""
+        self._dirty = False
+        count = len(self._active_ops)
+        if count == 0:
+            self._cached_msg = ""
+            return
+        if self._latest_tid is None:
+            # The latest op finished; fall back to the newest remaining one
+            self._latest_tid, self._latest_msg = next(reversed(self._active_ops.items()))
+        if count == 1:
+            self._cached_msg = self._latest_msg
+        else:
+            # Show count + the most recent active message
+            self._cached_msg = f"{self._latest_msg} (+{count - 1} more)"
+    
     def _animate(self):
-        """Background animation loop."""
-        while self._running:
-            with self._ops_lock:
-                count = len(self._active_ops)
-                if count == 0:
-                    break
-                elif count == 1:
-                    msg = list(self._active_ops.values())[0]
-                else:
-                    # Show count + one of the active messages
-                    sample = list(self._active_ops.values())[0]
-                    msg = f"{sample} (+{count - 1} more)"
-            
-            frame = _SPIN_FRAMES[self._frame_idx % 4]
-            line = f'\r  {frame} {msg}'
+        """Background animation loop.
+        
+        Runs for the life of the process: parks on the condition while no
+        ops are registered, wakes immediately on register()/unregister(),
+        and only advances the frame when the 150 ms tick times out.
+        """
+        while True:
+            with self._cv:
+                self._cv.wait_for(lambda: self._running)
+                if self._dirty:
+                    self._rebuild_message()
+                line = f'\r  {self._frame} {self._cached_msg}'
             
             with self._print_lock:
-                sys.stdout.write(line)
-                sys.stdout.flush()
+                self._write(line)
                 self._last_line_len = len(line)
             
-            self._frame_idx += 1
-            time.sleep(0.15)
-        
-        # Final cleanup
-        with self._print_lock:
-            self.clear_line()
+            with self._cv:
+                if not self._cv.wait_for(lambda: self._dirty, timeout=0.15):
+                    self._frame = next(self._frames)
+                stopped = not self._running
+            
+            if stopped:
+                with self._print_lock:
+                    self.clear_line()
 
 
 # ---------------------------------------------------------------------------
@@ -202,6 +273,14 @@ class DownloadTracker:
             self._active.clear()
 
 
+# ---------------------------------------------------------------------------
+# Progress bars (every fill level for the default width, built once)
+# ---------------------------------------------------------------------------
+
+_BAR_WIDTH = 20
+_BARS = ['█' * filled + '░' * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1)]
+
+
 # ---------------------------------------------------------------------------
 # IcebreakerConsole
 # ---------------------------------------------------------------------------
@@ -213,13 +292,22 @@ class IcebreakerConsole:
         self._rich = RichConsole(theme=_THEME, highlight=False)
         self._verbosity = Verbosity.from_env()
         self._print_lock = threading.Lock()
-        self._spinner = _SharedSpinner(self._print_lock)
+        self._is_tty = sys.stdout is not None and sys.stdout.isatty()
+        self._spinner = _SharedSpinner(self._print_lock, raw_tty=self._is_tty)
         self._download_tracker = DownloadTracker()
+        self._table_cache: dict[tuple, Table] = {}
 
     # -- internal -----------------------------------------------------------
 
-    def _safe_print(self, text: str) -> None:
-        """Print a line, clearing any active spinner first."""
+    def _safe_print(self, text: Union[str, Text]) -> None:
+        """Print a line, clearing any active spinner first.
+        
+        Rich's Console is thread-safe on its own, so the print lock is only
+        taken when a spinner line might need clearing.
+        """
+        if self._spinner.is_idle:
+            self._rich.print(text)
+            return
         with self._print_lock:
             self._spinner.clear_line()
             self._rich.print(text)
@@ -229,31 +317,50 @@ class IcebreakerConsole:
     def info(self, msg: str) -> None:
         """Background/context message (dim). Shown at normal+ verbosity."""
         if self._verbosity >= Verbosity.NORMAL:
-            self._safe_print(f"  [ib.info]{msg}[/]")
+            self._safe_print(_line(_PFX_INDENT, msg, "ib.info"))
 
     def success(self, msg: str) -> None:
         """Completed action. Shown at normal+ verbosity."""
         if self._verbosity >= Verbosity.NORMAL:
-            self._safe_print(f"  [ib.success]✓[/] {msg}")
+            self._safe_print(_line(_PFX_SUCCESS, msg))
 
     def warn(self, msg: str) -> None:
         """Non-fatal issue. Always shown (except quiet hides non-errors)."""
         if self._verbosity >= Verbosity.NORMAL:
-            self._safe_print(f"  [ib.warn]![/] {msg}")
+            self._safe_print(_line(_PFX_WARN, msg))
 
     def error(self, msg: str) -> None:
         """Failure. Always shown."""
-        self._safe_print(f"  [ib.error]✗[/] {msg}")
+        self._safe_print(_line(_PFX_ERROR, msg))
 
     def step(self, msg: str) -> None:
         """In-progress action. Shown at verbose only."""
         if self._verbosity >= Verbosity.VERBOSE:
-            self._safe_print(f"  [ib.step]›[/] {msg}")
+            self._safe_print(_line(_PFX_STEP, msg))
 
     def debug(self, msg: str) -> None:
         """Debug-level detail. Shown at verbose only."""
         if self._verbosity >= Verbosity.VERBOSE:
-            self._safe_print(f"  [ib.muted]{msg}[/]")
+            self._safe_print(_line(_PFX_INDENT, msg, "ib.muted"))
+
+    # -- lazy variants ------------------------------------------------------
+    # Take a callable so callers skip building the message entirely when
+    # the current verbosity would hide it.
+
+    def info_lazy(self, fn: Callable[[], str]) -> None:
+        """Like info(), but only calls fn() when the message will be shown."""
+        if self._verbosity >= Verbosity.NORMAL:
+            self.info(fn())
+
+    def step_lazy(self, fn: Callable[[], str]) -> None:
+        """Like step(), but only calls fn() when the message will be shown."""
+        if self._verbosity >= Verbosity.VERBOSE:
+            self.step(fn())
+
+    def debug_lazy(self, fn: Callable[[], str]) -> None:
+        """Like debug(), but only calls fn() when the message will be shown."""
+        if self._verbosity >= Verbosity.VERBOSE:
+            self.debug(fn())
 
     # -- spinner ------------------------------------------------------------
 
@@ -264,11 +371,14 @@ class IcebreakerConsole:
         Multiple threads can call this concurrently — they share a
         single global spinner daemon that cycles through | / - \\.
         
+        No-op when stdout is not a TTY (CI logs), where the carriage
+        returns would only pollute the output.
+        
         Usage:
             with console.spinning("Downloading from Snowflake..."):
                 cursor.execute(query)
         """
-        if self._verbosity < Verbosity.NORMAL:
+        if self._verbosity < Verbosity.NORMAL or not self._is_tty:
             yield
             return
         
@@ -297,12 +407,35 @@ class IcebreakerConsole:
         
         pct = min(current / total, 1.0)
         filled = int(width * pct)
-        empty = width - filled
-        bar = '█' * filled + '░' * empty
+        if width == _BAR_WIDTH:
+            bar = _BARS[filled]
+        else:
+            bar = '█' * filled + '░' * (width - filled)
         return f"[{bar}] {pct:>4.0%}"
 
     # -- structured output --------------------------------------------------
 
+    def _table_from_template(self, columns: list[tuple[str, str]]) -> Table:
+        """Return an empty Table with the given columns.
+        
+        Skeletons are cached per column signature. Rich stores cells on the
+        Column objects and row styles in ``rows``, so each caller gets a
+        shallow copy of the table with fresh (empty) columns and rows; the
+        cached template itself is never written to.
+        """
+        key = tuple(columns)
+        template = self._table_cache.get(key)
+        if template is None:
+            template = Table(show_edge=False, pad_edge=False, box=None)
+            for name, style in columns:
+                template.add_column(name, style=style)
+            self._table_cache[key] = template
+        
+        tbl = copy.copy(template)
+        tbl.columns = [column.copy() for column in template.columns]
+        tbl.rows = []
+        return tbl
+
     def panel(self, content: str, title: str = "", border_style: str = "cyan") -> None:
         """Display a bordered panel. Always shown."""
         self._safe_print("")  # Ensure spinner is cleared
@@ -318,9 +451,8 @@ class IcebreakerConsole:
             columns: list of (name, style) tuples
             rows: list of row data (list of strings)
         """
-        tbl = Table(title=title, show_edge=False, pad_edge=False, box=None)
-        for name, style in columns:
-            tbl.add_column(name, style=style)
+        tbl = self._table_from_template(columns)
+        tbl.title = title
         for row in rows:
             tbl.add_row(*row)
         self._safe_print("")  # Ensure spinner is cleared
@@ -341,12 +473,11 @@ class IcebreakerConsole:
             stats: dict of label → value
             footer: Optional footer text
         """
-        lines = []
-        max_key = max(len(k) for k in stats) if stats else 0
-        for key, value in stats.items():
-            lines.append(f"  [ib.label]{key:<{max_key}}[/]  {value}")
-
-        content = "\n".join(lines)
+        max_key = max(map(len, stats), default=0)
+        content = "\n".join([
+            f"  [ib.label]{key.ljust(max_key)}[/]  {value}"
+            for key, value in stats.items()
+        ])
         if footer:
             content += f"\n\n  [ib.muted]{footer}[/]"
 
@@ -5,6 +5,7 @@ Custom exceptions with actionable error messages that help users
 understand what went wrong and how to fix it.
 """
 
+import re
 from typing import Optional
 
 
@@ -20,26 +21,40 @@ class IcebreakerError(Exception):
         self.message = message
         self.suggestion = suggestion
         self.docs_url = docs_url
-        super().__init__(self.format())
+        # Formatted lazily in __str__; swallowed errors never pay for it
+        super().__init__(message)
+    
+    def __str__(self) -> str:
+        return self.format()
     
     def format(self) -> str:
         """Format error with suggestion and docs link."""
-        lines = [f"Error: {self.message}"]
+        result = f"Error: {self.message}"
         
         if self.suggestion:
-            lines.append("")
-            lines.append(f"Suggestion: {self.suggestion}")
+            result += f"\n\nSuggestion: {self.suggestion}"
         
         if self.docs_url:
-            lines.append(f"Docs: {self.docs_url}")
+            result += f"\nDocs: {self.docs_url}"
         
-        return "\n".join(lines)
+        return result
 
 
 # =============================================================================
 # Transpilation Errors
 # =============================================================================
 
+# Static suggestion text; only the truncated SQL is substituted per raise
+_TRANSPILE_SUGGESTION = (
+    "The following SQL uses Snowflake-specific features:\n"
+    "  %s\n\n"
+    "Options:\n"
+    "  1. Route to cloud: {{ config(icebreaker_route='cloud') }}\n"
+    "  2. Use ANSI SQL equivalents where possible\n"
+    "  3. Use Icebreaker's compatibility macros (coming soon)"
+)
+
+
 class TranspilationError(IcebreakerError):
     """SQL could not be transpiled from Snowflake to DuckDB."""
     
@@ -47,18 +62,80 @@ class TranspilationError(IcebreakerError):
         # Truncate SQL for display
         truncated = sql_snippet[:100] + "..." if len(sql_snippet) > 100 else sql_snippet
         
-        message = f"Could not transpile SQL to DuckDB-compatible syntax"
+        message = "Could not transpile SQL to DuckDB-compatible syntax"
         if original_error:
             message += f": {original_error}"
         
         super().__init__(
             message=message,
-            suggestion=(
-                f"The following SQL uses Snowflake-specific features:\n"
-                f"  {truncated}\n\n"
-                f"Options:\n"
-                f"  1. Route to cloud: {{{{ config(icebreaker_route='cloud') }}}}\n"
-                f"  2. Use ANSI SQL equivalents where possible\n"
-                f"  3. Use Icebreaker's compatibility macros (coming soon)"
-            ),
+            suggestion=_TRANSPILE_SUGGESTION % truncated,
+        )
+
+
+# =============================================================================
+# Execution Errors
+# =============================================================================
+
+# Whole words only (so "room_id" is not "oom"). The group number is the
+# priority: memory, then parse, then missing, whichever appears first
+_LOCAL_ERROR_PATTERN = re.compile(
+    r"\b(?:(memory|oom)|(syntax|parse[rd]?|parsing)|(not found|does not exist))\b",
+    re.IGNORECASE,
+)
+
+_LOCAL_ERROR_SUGGESTIONS = (
+    None,
+    "The model ran out of memory locally. Route it to cloud:\n"
+    "  {{ config(icebreaker_route='cloud') }}",
+    "DuckDB could not parse the SQL. Route to cloud or use ANSI SQL:\n"
+    "  {{ config(icebreaker_route='cloud') }}",
+    "A referenced table is missing locally. Refresh the source cache:\n"
+    "  icebreaker cache refresh",
+)
+
+
+def _local_error_suggestion(error: str) -> Optional[str]:
+    """Suggestion for the highest-priority category named in a DuckDB error."""
+    best = None
+    # One pass over the error, stopping early once the top priority is seen
+    for match in _LOCAL_ERROR_PATTERN.finditer(error):
+        if best is None or match.lastindex < best:
+            best = match.lastindex
+            if best == 1:
+                break
+    return _LOCAL_ERROR_SUGGESTIONS[best] if best else None
+
+
+class LocalExecutionError(IcebreakerError):
+    """Model failed while executing on DuckDB."""
+    
+    def __init__(self, model_name: str, original_error: Optional[str] = None):
+        message = f"Model '{model_name}' failed on local DuckDB"
+        if original_error:
+            message += f": {original_error}"
+        
+        super().__init__(
+            message=message,
+            suggestion=_local_error_suggestion(original_error or ""),
+        )
+
+
+# =============================================================================
+# Connection Errors
+# =============================================================================
+
+class SnowflakeConnectionError(IcebreakerError):
+    """Snowflake connection could not be opened."""
+    
+    def __init__(self, reason: str, missing_env_vars: Optional[list] = None):
+        suggestion = None
+        if missing_env_vars:
+            suggestion = (
+                "Set the following environment variables (or add them to .env):\n"
+                + "\n".join(f"  {var}" for var in missing_env_vars)
+            )
+        
+        super().__init__(
+            message=f"Could not connect to Snowflake: {reason}",
+            suggestion=suggestion,
         )
@@ -6,44 +6,94 @@ Compares local state vs cloud state to detect drift and ensure data consistency.
 
 import os
 import json
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import sqlite3
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
 
 from dbt.adapters.icebreaker.console import console
 
+# Try to import ijson for streaming manifest parsing
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+
+# Icebreaker state files, resolved once at import
+_IB_HOME = os.path.expanduser("~/.icebreaker")
+_DUCKDB_PATH = os.path.join(_IB_HOME, "local.duckdb")
+_CACHE_MANIFEST = os.path.join(_IB_HOME, "cache", "manifest.json")
+_SAVINGS_DB = os.path.join(_IB_HOME, "savings.db")
+_LEDGER_DB = os.path.join(_IB_HOME, "sync_ledger.db")
+
+# Lengths of naive datetime.isoformat() output, with and without microseconds
+_NAIVE_ISO_LENGTHS = (19, 26)
+
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
-    """Result of a single health check."""
+    """Result of a single health check. ``details`` holds flat scalar values."""
     check_name: str
     status: str  # "OK", "WARNING", "ERROR"
     message: str
-    details: Optional[Dict] = None
+    details: Optional[Dict[str, Any]] = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict; a shallow copy, unlike dataclasses.asdict's deep copy."""
+        return {
+            "check_name": self.check_name,
+            "status": self.status,
+            "message": self.message,
+            "details": dict(self.details) if self.details is not None else None,
+        }
     
     def __str__(self) -> str:
         marker = {"OK": "[OK]", "WARNING": "[WARN]", "ERROR": "[ERR]"}.get(self.status, "[-]")
         return f"{marker} {self.check_name}: {self.message}"
 
 
-@dataclass 
+@dataclass(slots=True)
+class DriftResult:
+    """Row count mismatch for one table between local and cloud."""
+    table: str
+    local_count: int
+    cloud_count: int
+    diff: int
+    diff_pct: float
+
+
+@dataclass(slots=True)
 class HealthReport:
     """Full health check report."""
     timestamp: str
     overall_status: str
     checks: List[HealthCheckResult]
+    _counts: Counter = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # One pass over checks; each count below is then a dict lookup
+        self._counts = Counter(c.status for c in self.checks)
     
     @property
     def ok_count(self) -> int:
-        return sum(1 for c in self.checks if c.status == "OK")
+        return self._counts["OK"]
     
     @property
     def warning_count(self) -> int:
-        return sum(1 for c in self.checks if c.status == "WARNING")
+        return self._counts["WARNING"]
     
     @property
     def error_count(self) -> int:
-        return sum(1 for c in self.checks if c.status == "ERROR")
+        return self._counts["ERROR"]
 
 
 class HealthChecker:
@@ -63,24 +113,46 @@ class HealthChecker:
         duckdb_path: Optional[str] = None,
         snowflake_conn: Optional[Any] = None,
     ):
-        self.duckdb_path = duckdb_path or os.path.expanduser("~/.icebreaker/local.duckdb")
+        self.duckdb_path = duckdb_path or _DUCKDB_PATH
         self.snowflake_conn = snowflake_conn
+        self._duck = None
+        # ((st_mtime_ns, st_size), table count, total bytes, created_at values)
+        # of the last manifest parsed by _check_cache
+        self._manifest_cache: Optional[Tuple[Tuple[int, int], int, int, List[str]]] = None
+    
+    def __enter__(self) -> "HealthChecker":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _duck_conn(self):
+        """Read-only DuckDB connection, opened on first use and reused across checks."""
+        if self._duck is None:
+            import duckdb
+            self._duck = duckdb.connect(self.duckdb_path, read_only=True)
+        return self._duck
+    
+    def close(self) -> None:
+        """Close the cached DuckDB connection, releasing its file lock."""
+        if self._duck is not None:
+            self._duck.close()
+            self._duck = None
     
     def run_all_checks(self) -> HealthReport:
         """Run all health checks and return a report."""
-        checks = []
-        
-        # Check local database
-        checks.append(self._check_local_database())
-        
-        # Check cache
-        checks.append(self._check_cache())
-        
-        # Check savings tracking
-        checks.append(self._check_savings_db())
+        sub_checks = (
+            self._check_local_database,
+            self._check_cache,
+            self._check_savings_db,
+            self._check_sync_ledger,
+        )
         
-        # Check sync ledger
-        checks.append(self._check_sync_ledger())
+        # Each check does its own file and database I/O (only the local
+        # database check touches the shared DuckDB connection), so overlap
+        # them; map() keeps the results in display order
+        with ThreadPoolExecutor(max_workers=len(sub_checks)) as pool:
+            checks = list(pool.map(lambda check: check(), sub_checks))
         
         # Determine overall status
         if any(c.status == "ERROR" for c in checks):
@@ -106,8 +178,7 @@ class HealthChecker:
             )
         
         try:
-            import duckdb
-            conn = duckdb.connect(self.duckdb_path, read_only=True)
+            conn = self._duck_conn()
             
             # Count tables
             result = conn.execute("""
@@ -116,8 +187,6 @@ class HealthChecker:
             """).fetchone()
             table_count = result[0] if result else 0
             
-            conn.close()
-            
             return HealthCheckResult(
                 check_name="Local Database",
                 status="OK",
@@ -128,15 +197,16 @@ class HealthChecker:
             return HealthCheckResult(
                 check_name="Local Database",
                 status="ERROR",
-                message=f"Connection failed: {str(e)[:50]}",
+                message=f"Connection failed: {_short_error(e)}",
             )
     
     def _check_cache(self) -> HealthCheckResult:
         """Check source cache status."""
-        cache_dir = os.path.expanduser("~/.icebreaker/cache")
-        manifest_path = os.path.join(cache_dir, "manifest.json")
+        manifest_path = _CACHE_MANIFEST
         
-        if not os.path.exists(manifest_path):
+        try:
+            st = os.stat(manifest_path)
+        except FileNotFoundError:
             return HealthCheckResult(
                 check_name="Source Cache",
                 status="OK",
@@ -144,27 +214,33 @@ class HealthChecker:
             )
         
         try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
-            
-            table_count = len(manifest)
-            total_size = sum(
-                e.get("size_bytes", 0) for e in manifest.values()
-            )
-            size_gb = total_size / (1024**3)
+            # Reparse only when the manifest changed since the last check
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._manifest_cache
+            if cached is not None and cached[0] == key:
+                _, table_count, total_size, created_values = cached
+            else:
+                table_count, total_size, created_values = _read_manifest(manifest_path)
+                self._manifest_cache = (key, table_count, total_size, created_values)
             
-            # Check for stale entries (>24h old)
+            # Staleness depends on the clock, so it is recounted on every call.
+            # Naive ISO timestamps (as written by SourceCache) sort
+            # lexicographically, so compare strings directly
+            cutoff_dt = datetime.now() - timedelta(hours=24)
+            cutoff = cutoff_dt.isoformat()
             stale_count = 0
-            for entry in manifest.values():
-                created = entry.get("created_at", "")
-                if created:
-                    try:
-                        created_dt = datetime.fromisoformat(created)
-                        age_hours = (datetime.now() - created_dt).total_seconds() / 3600
-                        if age_hours > 24:
-                            stale_count += 1
-                    except Exception as e:
-                        console.debug(f"Could not parse cache timestamp: {e}")
+            for created in created_values:
+                if len(created) in _NAIVE_ISO_LENGTHS:
+                    if created < cutoff:
+                        stale_count += 1
+                    continue
+                try:
+                    if datetime.fromisoformat(created) < cutoff_dt:
+                        stale_count += 1
+                except Exception as e:
+                    console.debug(f"Could not parse cache timestamp: {e}")
+            
+            size_gb = total_size / (1024**3)
             
             status = "WARNING" if stale_count > 0 else "OK"
             msg = f"{table_count} tables cached ({size_gb:.1f}GB)"
@@ -181,12 +257,12 @@ class HealthChecker:
             return HealthCheckResult(
                 check_name="Source Cache",
                 status="ERROR",
-                message=f"Cache check failed: {str(e)[:50]}",
+                message=f"Cache check failed: {_short_error(e)}",
             )
     
     def _check_savings_db(self) -> HealthCheckResult:
         """Check savings tracking database."""
-        db_path = os.path.expanduser("~/.icebreaker/savings.db")
+        db_path = _SAVINGS_DB
         
         if not os.path.exists(db_path):
             return HealthCheckResult(
@@ -196,8 +272,7 @@ class HealthChecker:
             )
         
         try:
-            import sqlite3
-            conn = sqlite3.connect(db_path)
+            conn = _connect_sqlite_readonly(db_path)
             cursor = conn.cursor()
             
             cursor.execute("SELECT COUNT(*), COALESCE(SUM(savings), 0) FROM executions")
@@ -217,12 +292,12 @@ class HealthChecker:
             return HealthCheckResult(
                 check_name="Savings Tracking",
                 status="ERROR",
-                message=f"Database error: {str(e)[:50]}",
+                message=f"Database error: {_short_error(e)}",
             )
     
     def _check_sync_ledger(self) -> HealthCheckResult:
         """Check sync ledger status."""
-        ledger_path = os.path.expanduser("~/.icebreaker/sync_ledger.db")
+        ledger_path = _LEDGER_DB
         
         if not os.path.exists(ledger_path):
             return HealthCheckResult(
@@ -232,18 +307,15 @@ class HealthChecker:
             )
         
         try:
-            import sqlite3
-            conn = sqlite3.connect(ledger_path)
+            conn = _connect_sqlite_readonly(ledger_path)
             cursor = conn.cursor()
             
-            # Get recent sync stats
+            # Get recent sync stats (success/verified are 0/1 flags; range scan
+            # on idx_sync_time, which SyncLedger creates)
             cursor.execute("""
-                SELECT 
-                    COUNT(*),
-                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END),
-                    SUM(CASE WHEN verified = 1 THEN 1 ELSE 0 END)
-                FROM syncs
-                WHERE timestamp > datetime('now', '-24 hours')
+                SELECT COUNT(*), SUM(success), SUM(verified)
+                FROM sync_history
+                WHERE synced_at > datetime('now', '-24 hours')
             """)
             row = cursor.fetchone()
             total = row[0] or 0
@@ -272,13 +344,13 @@ class HealthChecker:
             return HealthCheckResult(
                 check_name="Sync Ledger",
                 status="WARNING",
-                message=f"Could not read ledger: {str(e)[:30]}",
+                message=f"Could not read ledger: {_short_error(e, 30)}",
             )
     
     def detect_drift(
         self,
         tables: Optional[List[str]] = None,
-    ) -> List[Dict]:
+    ) -> List[DriftResult]:
         """
         Detect row count drift between local and Snowflake.
         
@@ -290,85 +362,189 @@ class HealthChecker:
         drift = []
         
         try:
-            import duckdb
-            local_conn = duckdb.connect(self.duckdb_path, read_only=True)
-            
-            # Get tables to check
-            if not tables:
-                result = local_conn.execute("""
-                    SELECT table_schema || '.' || table_name 
-                    FROM information_schema.tables
-                    WHERE table_schema NOT IN ('information_schema', 'pg_catalog', 'main')
-                      AND table_type = 'BASE TABLE'
-                    LIMIT 20
-                """).fetchall()
-                tables = [r[0] for r in result]
+            local_conn = self._duck_conn()
             
-            sf_cursor = self.snowflake_conn.cursor()
-            
-            for table in tables:
-                parts = table.split(".")
-                if len(parts) != 2:
-                    continue
-                schema, table_name = parts
+            # One Snowflake cursor serves every table; closed even if counting
+            # fails part-way
+            with self.snowflake_conn.cursor() as sf_cursor:
+                # Get tables to check
+                if not tables:
+                    # duckdb_tables() lists base tables straight from the catalog,
+                    # skipping the information_schema view machinery
+                    result = local_conn.execute("""
+                        SELECT schema_name || '.' || table_name
+                        FROM duckdb_tables()
+                        WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'main')
+                          AND NOT temporary
+                        LIMIT 20
+                    """).fetchall()
+                    tables = [r[0] for r in result]
+                
+                # Only names that parse as a plain schema.table reach the SQL,
+                # re-rendered by sqlglot for each side's dialect
+                local_names = _render_tables(tables, "duckdb")
+                sf_names = _render_tables(tables, "snowflake")
+                
+                def run_sf(sql: str) -> List[tuple]:
+                    sf_cursor.execute(sql)
+                    return sf_cursor.fetchall()
+                
+                # One round-trip per side instead of one per table; the two sides
+                # are independent, so overlap the local scan with Snowflake latency
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    sf_future = pool.submit(_count_rows, run_sf, sf_names)
+                    local_counts = _count_rows(
+                        lambda sql: local_conn.execute(sql).fetchall(), local_names
+                    )
+                    sf_counts = sf_future.result()
+                
+                for table in tables:
+                    if table not in local_counts or table not in sf_counts:
+                        continue  # Table might not exist in one or the other
+                    local_count = local_counts[table]
+                    sf_count = sf_counts[table]
                 
-                try:
-                    # Local count
-                    local_count = local_conn.execute(
-                        f"SELECT COUNT(*) FROM {schema}.{table_name}"
-                    ).fetchone()[0]
-                    
-                    # Snowflake count
-                    sf_cursor.execute(f"SELECT COUNT(*) FROM {schema}.{table_name}")
-                    sf_count = sf_cursor.fetchone()[0]
-                    
                     if local_count != sf_count:
                         diff = abs(local_count - sf_count)
-                        drift.append({
-                            "table": table,
-                            "local_count": local_count,
-                            "cloud_count": sf_count,
-                            "diff": diff,
-                            "diff_pct": (diff / max(local_count, 1)) * 100,
-                        })
-                except Exception:
-                    pass  # Table might not exist in one or the other
-            
-            local_conn.close()
-            sf_cursor.close()
-            
+                        drift.append(DriftResult(
+                            table=table,
+                            local_count=local_count,
+                            cloud_count=sf_count,
+                            diff=diff,
+                            diff_pct=(diff / max(local_count, 1)) * 100,
+                        ))
+        
         except Exception as e:
             console.debug(f"Drift detection failed: {e}")
         
         return drift
 
 
-def format_health_report(report: HealthReport) -> str:
-    """Format health report for display."""
-    lines = [
-        "",
-        "ICEBREAKER HEALTH CHECK",
-        "=" * 50,
-        f"   Timestamp: {report.timestamp[:19]}",
-        f"   Status: {report.overall_status}",
-        "",
-    ]
+def _short_error(e: BaseException, limit: int = 50) -> str:
+    """First ``limit`` chars of an error's message, skipping the full str() when args[0] is it."""
+    # args[0] is not always the message: OSError puts the errno there and
+    # KeyError the bare key (str() quotes it), so those go through str(e)
+    if e.args and isinstance(e.args[0], str) and not isinstance(e, KeyError):
+        return e.args[0][:limit]
+    return str(e)[:limit] or type(e).__name__
+
+
+def _connect_sqlite_readonly(path: str) -> sqlite3.Connection:
+    """Open a SQLite database read-only so checks never block a concurrent writer."""
+    conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+    conn.execute("PRAGMA query_only = 1")
+    return conn
+
+
+def _iter_manifest(f) -> Iterable[Tuple[str, Dict]]:
+    """Yield (key, entry) pairs from a cache manifest, streaming when ijson is installed."""
+    if HAS_IJSON:
+        return ijson.kvitems(f, "", use_float=True)
+    return json.load(f).items()
+
+
+def _read_manifest(path: str) -> Tuple[int, int, List[str]]:
+    """Table count, total size in bytes and non-empty created_at values of a cache manifest."""
+    table_count = 0
+    total_size = 0
+    created_values = []
+    with open(path, 'rb') as f:
+        for _, entry in _iter_manifest(f):
+            table_count += 1
+            total_size += entry.get("size_bytes", 0)
+            created = entry.get("created_at", "")
+            if created:
+                created_values.append(created)
+    return table_count, total_size, created_values
+
+
+def _render_tables(tables: Iterable[str], dialect: str) -> Dict[str, str]:
+    """
+    Map each ``schema.table`` name to its sqlglot rendering for ``dialect``.
+    
+    Anything that is not a plain two-part table name (extra clauses,
+    function calls, statements, three-part names) is rejected and left out.
+    """
+    rendered = {}
+    for name in tables:
+        try:
+            table = sqlglot.parse_one(name, into=exp.Table, dialect=dialect)
+        except ParseError:
+            table = None
+        if (
+            table is None
+            or not isinstance(table.this, exp.Identifier)
+            or not isinstance(table.args.get("db"), exp.Identifier)
+            or any(v is not None for k, v in table.args.items() if k not in ("this", "db"))
+        ):
+            console.debug(f"Skipping drift check for invalid table name: {name!r}")
+            continue
+        rendered[name] = table.sql(dialect=dialect, comments=False)
+    return rendered
+
+
+def _count_rows(run: Callable[[str], List[tuple]], tables: Dict[str, str]) -> Dict[str, int]:
+    """
+    Count rows for every table in a single UNION ALL query.
     
-    for check in report.checks:
-        lines.append(f"   {check}")
+    ``tables`` maps each table name to its already rendered SQL identifier
+    (see _render_tables). If the batch fails (e.g. one table is missing on
+    this side), falls back to per-table counts so the remaining tables are
+    still compared.
+    """
+    if not tables:
+        return {}
     
-    lines.extend([
-        "",
-        f"   Summary: {report.ok_count} OK, {report.warning_count} warnings, {report.error_count} errors",
-        "=" * 50,
-        "",
-    ])
+    names = list(tables)
+    batch_sql = " UNION ALL ".join(
+        f"SELECT {i} AS idx, COUNT(*) AS cnt FROM {tables[name]}"
+        for i, name in enumerate(names)
+    )
+    try:
+        return {names[idx]: cnt for idx, cnt in run(batch_sql)}
+    except Exception as e:
+        console.debug(f"Batched row count failed, counting per table: {e}")
     
-    return "\n".join(lines)
+    counts = {}
+    for name, table_sql in tables.items():
+        try:
+            counts[name] = run(f"SELECT COUNT(*) FROM {table_sql}")[0][0]
+        except Exception:
+            pass
+    return counts
+
+
+_SEP = "=" * 50
+_REPORT_HEADER = (
+    "\nICEBREAKER HEALTH CHECK\n" + _SEP + "\n"
+    "   Timestamp: {timestamp}\n"
+    "   Status: {status}\n"
+    "\n"
+)
+_REPORT_FOOTER = (
+    "\n"
+    "   Summary: {ok} OK, {warnings} warnings, {errors} errors\n"
+    + _SEP + "\n"
+)
+
+
+def format_health_report(report: HealthReport) -> str:
+    """Format health report for display."""
+    header = _REPORT_HEADER.format(
+        timestamp=report.timestamp[:19],
+        status=report.overall_status,
+    )
+    body = "".join(f"   {check}\n" for check in report.checks)
+    footer = _REPORT_FOOTER.format(
+        ok=report.ok_count,
+        warnings=report.warning_count,
+        errors=report.error_count,
+    )
+    return header + body + footer
 
 
 def run_health_check() -> str:
     """Run health check and return formatted report."""
-    checker = HealthChecker()
-    report = checker.run_all_checks()
+    with HealthChecker() as checker:
+        report = checker.run_all_checks()
     return format_health_report(report)
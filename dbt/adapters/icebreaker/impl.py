@@ -5,8 +5,14 @@ Main adapter class that inherits from dbt's BaseAdapter.
 Handles model execution with intelligent routing between local and cloud.
 """
 
+import os
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import agate
 
 from dbt.adapters.base import available
@@ -20,11 +26,159 @@ from dbt.adapters.icebreaker.connections import (
     IcebreakerConnectionManager,
 )
 from dbt.adapters.icebreaker.relation import IcebreakerRelation
-from dbt.adapters.icebreaker.transpiler import Transpiler, TranspilationError
-from dbt.adapters.icebreaker.savings import log_execution
+from dbt.adapters.icebreaker.transpiler import Transpiler, TranspilationError, get_transpiler
+from dbt.adapters.icebreaker.savings import flush_pending, log_execution
 from dbt.adapters.icebreaker.auto_router import AutoRouter
+from dbt.adapters.icebreaker.bridge import Bridge, CatalogRegistrar, IcebergConfig
 from dbt.adapters.icebreaker.catalog_scanner import CatalogScanner
+from dbt.adapters.icebreaker.traffic import TrafficConfig, TrafficController
 from dbt.adapters.icebreaker.console import console
+from dbt.adapters.icebreaker.errors import LocalExecutionError
+
+
+# Case-insensitive LIMIT keyword, matched without upper-casing the whole SQL
+_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+# Statements that cannot change the catalog (everything else invalidates it)
+_READ_ONLY_SQL = re.compile(r"\s*(select|with|describe|show|explain)\b", re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
+class _ExplicitDecision:
+    """Routing decision forced by a model's icebreaker_route config."""
+    venue: str
+    reason: str
+
+
+_EXPLICIT_CLOUD = _ExplicitDecision("cloud", "icebreaker_route='cloud'")
+_EXPLICIT_LOCAL = _ExplicitDecision("local", "icebreaker_route='local'")
+# Normalized icebreaker_route value -> decision; MotherDuck runs on the cloud path
+_EXPLICIT_ROUTES = {
+    "cloud": _EXPLICIT_CLOUD,
+    "motherduck": _EXPLICIT_CLOUD,
+    "local": _EXPLICIT_LOCAL,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class ResolvedCreds:
+    """Per-model credential settings with their defaults applied."""
+    cloud_type: str
+    cloud_bridge_type: Optional[str]
+    catalog_integration: Optional[str]
+    external_volume: Optional[str]
+    
+    @classmethod
+    def from_credentials(cls, credentials: Any) -> "ResolvedCreds":
+        return cls(
+            cloud_type=getattr(credentials, 'cloud_type', 'snowflake') or 'snowflake',
+            cloud_bridge_type=getattr(credentials, 'cloud_bridge_type', None),
+            catalog_integration=getattr(credentials, 'cloud_bridge_catalog_integration', None),
+            external_volume=getattr(credentials, 'cloud_bridge_external_volume', None),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ModelCtx:
+    """Model node fields used on the execution path, read from the node once."""
+    name: str
+    schema: str
+    alias: str
+    config: Dict[str, Any]
+    # The node itself, for components that inspect more of it (traffic gates)
+    node: Dict[str, Any]
+    
+    @classmethod
+    def from_node(cls, model: Dict[str, Any]) -> "ModelCtx":
+        return cls(
+            name=model.get("name", "unknown"),
+            schema=model.get("schema", "public"),
+            alias=model.get("alias", model.get("name", "unnamed")),
+            config=model.get("config", {}),
+            node=model,
+        )
+
+
+# Materializations whose result rows dbt never reads; skip fetching them
+_STATUS_ONLY_MATERIALIZATIONS = frozenset({"table", "view", "incremental"})
+
+
+def _fetch_columnar(cursor: Any) -> Any:
+    """Fetch a cursor's rows as an Arrow table when supported, else as tuples."""
+    if cursor is None:
+        return None
+    if hasattr(cursor, "fetch_arrow_table"):
+        return cursor.fetch_arrow_table()
+    return cursor.fetchall()
+
+
+def _row_count(result: Any) -> int:
+    """Row count for telemetry, read from metadata without walking the rows."""
+    if result is None:
+        return 0
+    if hasattr(result, "num_rows"):
+        return result.num_rows
+    if isinstance(result, agate.Table):
+        return len(result.rows)
+    return len(result)
+
+
+def _agate_type_for_arrow(arrow_type: Any) -> Any:
+    """Map an Arrow column type to the closest agate data type."""
+    import pyarrow.types as pat
+    
+    if pat.is_integer(arrow_type) or pat.is_floating(arrow_type) or pat.is_decimal(arrow_type):
+        return agate.Number()
+    if pat.is_boolean(arrow_type):
+        return agate.Boolean()
+    if pat.is_date(arrow_type):
+        return agate.Date()
+    if pat.is_timestamp(arrow_type):
+        return agate.DateTime()
+    return agate.Text()
+
+
+# Exact DuckDB base type name -> agate type, for rows fetched as plain tuples
+_DUCKDB_AGATE_TYPES = {
+    **dict.fromkeys(
+        ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "UTINYINT", "USMALLINT",
+         "UINTEGER", "UBIGINT", "FLOAT", "DOUBLE", "DECIMAL", "REAL", "NUMBER"),
+        agate.Number,
+    ),
+    **dict.fromkeys(("BOOLEAN", "BOOL"), agate.Boolean),
+    **dict.fromkeys(
+        ("TIMESTAMP", "TIMESTAMP WITH TIME ZONE", "TIMESTAMPTZ", "TIMESTAMP_S",
+         "TIMESTAMP_MS", "TIMESTAMP_NS", "DATETIME"),
+        agate.DateTime,
+    ),
+    "DATE": agate.Date,
+}
+
+
+def _agate_type_for_duckdb(type_code: Any) -> Any:
+    """Map a cursor description type code to the closest agate data type."""
+    name = str(type_code).upper()
+    # Arrays (INTEGER[], DECIMAL(10,2)[3]) hold lists, not scalars
+    if "[" in name:
+        return agate.Text()
+    # DECIMAL(10,2) -> DECIMAL; STRUCT(...), MAP(...), UNION(...) fall through to Text
+    base = name.split("(", 1)[0].strip()
+    return _DUCKDB_AGATE_TYPES.get(base, agate.Text)()
+
+
+# Constant text with a bound schema: one plan (and one transpile-cache entry)
+# for every schema instead of a fresh literal per call
+_SCHEMA_CATALOG_SQL = """
+SELECT t.table_name, t.table_type, c.column_name, c.data_type,
+       c.is_nullable, c.column_default
+FROM information_schema.tables t
+LEFT JOIN information_schema.columns c
+  ON c.table_schema = t.table_schema AND c.table_name = t.table_name
+WHERE t.table_schema = ?
+ORDER BY t.table_name, c.ordinal_position
+"""
+
+_SCHEMA_EXISTS_SQL = "SELECT 1 FROM information_schema.schemata WHERE schema_name = ? LIMIT 1"
 
 
 class IcebreakerAdapter(SQLAdapter):
@@ -65,15 +219,103 @@ class IcebreakerAdapter(SQLAdapter):
         self._transpiler: Optional[Transpiler] = None
         self._auto_router: Optional[AutoRouter] = None
         self._catalog_scanner: Optional[CatalogScanner] = None
+        # Per-thread DDL buffer, set only inside a ddl_batch() window
+        self._ddl_state = threading.local()
+        # schema -> {table_name: (table_type, describe-style column rows)}
+        self._catalog_cache: Dict[str, Dict[str, Tuple[str, List[tuple]]]] = {}
+        self._schema_exists_cache: Dict[str, bool] = {}
+        # ICEBREAKER_TELEMETRY=0 turns off per-model savings logging
+        self._telemetry_enabled = os.environ.get("ICEBREAKER_TELEMETRY", "1") != "0"
+        # Per-model local savings, reported as one line in cleanup_connections
+        self._run_savings: List[float] = []
+        # (schema, table) Iceberg refreshes, run together in cleanup_connections
+        self._pending_refreshes: List[Tuple[str, str]] = []
+        # venue -> executor; anything that is not local runs on the cloud path
+        self._venue_dispatch = {
+            "local": self._execute_local,
+            "cloud": self._execute_cloud,
+        }
+        # Pay SQLGlot import/grammar setup while dbt parses the manifest
+        threading.Thread(
+            target=self._warm, name="icebreaker-warmup", daemon=True
+        ).start()
+    
+    def _warm(self) -> None:
+        """Build the transpiler and router ahead of the first model."""
+        try:
+            self.transpiler.to_duckdb("SELECT 1")
+            self.auto_router
+        except Exception as e:
+            # Warmup is best-effort; the lazy properties retry on first use
+            console.debug(f"Adapter warmup skipped: {e}")
     
     @property
     def transpiler(self) -> Transpiler:
         """Lazy-initialize the transpiler."""
         if self._transpiler is None:
             source_dialect = self.config.credentials.source_dialect
-            self._transpiler = Transpiler(source_dialect=source_dialect)
+            self._transpiler = get_transpiler(source_dialect)
         return self._transpiler
     
+    @cached_property
+    def _creds(self) -> "ResolvedCreds":
+        """Credential settings read on every model, resolved once per run."""
+        return ResolvedCreds.from_credentials(self.config.credentials)
+    
+    @cached_property
+    def _bridge(self) -> Bridge:
+        """Iceberg DDL bridge for the configured cloud, built once per run."""
+        credentials = self.config.credentials
+        return Bridge(credentials.cloud_bridge_type, credentials)
+    
+    @cached_property
+    def _traffic_controller(self) -> TrafficController:
+        """Traffic controller bound to this run's credentials, built once."""
+        credentials = self.config.credentials
+        return TrafficController(TrafficConfig(
+            max_local_seconds=getattr(credentials, 'max_local_seconds', 600),
+            max_local_size_gb=getattr(credentials, 'max_local_size_gb', 5.0),
+            source_dialect=getattr(credentials, 'source_dialect', 'snowflake'),
+        ))
+    
+    def cleanup_connections(self) -> None:
+        """Report the run's accumulated local savings, then close connections."""
+        self._drain_catalog_refreshes()
+        # Write the run's buffered execution records in one transaction
+        flush_pending()
+        savings, self._run_savings = self._run_savings, []
+        if savings:
+            console.success(
+                f"Saved ${sum(savings):.2f} by running {len(savings)} model(s) locally"
+            )
+        super().cleanup_connections()
+    
+    def _drain_catalog_refreshes(self) -> None:
+        """Refresh every table a cloud model wrote this run, concurrently and once each."""
+        pending, self._pending_refreshes = self._pending_refreshes, []
+        if not pending or self._catalog_registrar is None:
+            return
+        try:
+            results = self._catalog_registrar.refresh_tables(pending)
+        except Exception as e:
+            console.warn(f"Catalog refresh failed for {len(pending)} table(s): {e}")
+            return
+        for table_id, refreshed in results.items():
+            if not refreshed:
+                console.debug(f"Catalog refresh skipped or failed for {table_id}")
+    
+    @cached_property
+    def _catalog_registrar(self) -> Optional[CatalogRegistrar]:
+        """Catalog registrar shared by all cloud models, so the catalog loads once."""
+        credentials = self.config.credentials
+        catalog_type = getattr(credentials, 'catalog_type', None)
+        if not catalog_type:
+            return None
+        return CatalogRegistrar(
+            catalog_type=catalog_type,
+            catalog_uri=getattr(credentials, 'catalog_uri', None),
+        )
+    
     @property
     def auto_router(self) -> AutoRouter:
         """Lazy-initialize the automatic router."""
@@ -153,7 +395,7 @@ class IcebreakerAdapter(SQLAdapter):
     
     def decide_venue(
         self,
-        model: Dict[str, Any],
+        ctx: ModelCtx,
         sql: str,
         sources: Optional[List[Dict]] = None,
     ) -> str:
@@ -165,42 +407,24 @@ class IcebreakerAdapter(SQLAdapter):
         2. Use Traffic Controller for intelligent routing
         
         Args:
-            model: The full model node (not just config)
+            ctx: The model's fields, extracted once by execute_model
             sql: The SQL to execute
             sources: Optional source metadata
             
         Returns:
             'local' for DuckDB, 'cloud' for MotherDuck
         """
-        model_name = model.get("name", "unknown")
-        config = model.get("config", {})
+        model_name = ctx.name
         
         # Priority 1: Check for explicit routing config
-        explicit_route = config.get("icebreaker_route")
-        if explicit_route:
-            route = explicit_route.lower()
-            if route in ("cloud", "motherduck"):
-                self._log_routing_decision(model_name, type("Decision", (), {"venue": "cloud", "reason": "icebreaker_route='cloud'"})())
-                return "cloud"
-            elif route == "local":
-                self._log_routing_decision(model_name, type("Decision", (), {"venue": "local", "reason": "icebreaker_route='local'"})())
-                return "local"
+        explicit_route = ctx.config.get("icebreaker_route")
+        explicit = _EXPLICIT_ROUTES.get(explicit_route.lower()) if explicit_route else None
+        if explicit is not None:
+            self._log_routing_decision(model_name, explicit)
+            return explicit.venue
         
         # Priority 2: Use Traffic Controller for intelligent routing
-        from dbt.adapters.icebreaker.traffic import (
-            TrafficController,
-            TrafficConfig,
-        )
-        
-        credentials = self.config.credentials
-        traffic_config = TrafficConfig(
-            max_local_seconds=getattr(credentials, 'max_local_seconds', 600),
-            max_local_size_gb=getattr(credentials, 'max_local_size_gb', 5.0),
-            source_dialect=getattr(credentials, 'source_dialect', 'snowflake'),
-        )
-        
-        controller = TrafficController(traffic_config)
-        decision = controller.decide(model, sql, sources)
+        decision = self._traffic_controller.decide(ctx.node, sql, sources)
         
         self._log_routing_decision(model_name, decision)
         
@@ -237,19 +461,26 @@ class IcebreakerAdapter(SQLAdapter):
         Returns:
             Tuple of (status message, result table)
         """
-        model_config = model.get("config", {})
-        venue = self.decide_venue(model, sql)
+        ctx = ModelCtx.from_node(model)
+        venue = self.decide_venue(ctx, sql)
         
-        if venue == "local":
-            return self._execute_local(model, sql, model_config)
-        else:
-            return self._execute_cloud(model, sql, model_config)
+        # Materializations only need the status, not the rows
+        fetch_results = ctx.config.get("materialized") not in _STATUS_ONLY_MATERIALIZATIONS
+        
+        execute = self._venue_dispatch.get(venue, self._execute_cloud)
+        # The model creates or replaces a relation. Invalidate on both sides:
+        # another thread may re-cache the old catalog while this one runs
+        self._invalidate_catalog()
+        try:
+            return execute(ctx, sql, fetch_results)
+        finally:
+            self._invalidate_catalog()
     
     def _execute_local(
         self,
-        model: Dict[str, Any],
+        ctx: "ModelCtx",
         sql: str,
-        config: Dict[str, Any],
+        fetch_results: bool = True,
     ) -> Tuple[str, agate.Table]:
         """
         Execute model locally using DuckDB.
@@ -260,8 +491,8 @@ class IcebreakerAdapter(SQLAdapter):
         3. Execute on DuckDB
         4. Log savings
         """
-        model_name = model.get("name", "unknown")
-        start_time = time.time()
+        model_name = ctx.name
+        start_time = time.perf_counter()
         
         # Transpile to DuckDB
         try:
@@ -272,41 +503,49 @@ class IcebreakerAdapter(SQLAdapter):
         # Apply dev sampling
         target_name = self.config.target_name
         if target_name == "dev":
-            duckdb_sql = self._apply_dev_sampling(duckdb_sql, config)
+            duckdb_sql = self._apply_dev_sampling(duckdb_sql, ctx.config)
         
         # Execute on DuckDB
         self.connections.set_engine("duckdb")
-        response, result = self.connections.execute(duckdb_sql, fetch=True)
-        
-        # Calculate execution time and log savings
-        execution_time = time.time() - start_time
-        rows = len(result) if result else 0
+        try:
+            _, cursor = self.connections.add_query(duckdb_sql, auto_begin=False)
+            # Columnar fetch: DuckDB hands back Arrow buffers, no per-row tuples
+            result = _fetch_columnar(cursor) if fetch_results else None
+            description = getattr(cursor, "description", None)
+        except DbtRuntimeError as e:
+            raise DbtRuntimeError(str(LocalExecutionError(model_name, str(e)))) from e
         
         # Log execution for savings tracking
-        try:
-            cloud_type = getattr(self.config.credentials, 'cloud_type', 'snowflake') or 'snowflake'
-            execution = log_execution(
-                model_name=model_name,
-                engine_used='duckdb',
-                execution_time_seconds=execution_time,
-                rows_processed=rows,
-                cloud_type=cloud_type,
-            )
-            if execution.savings > 0.01:  # Only show if meaningful
-                console.success(f"Saved ${execution.savings:.2f} by running locally")
-        except Exception:
-            pass  # Don't fail the query if logging fails
+        if self._telemetry_enabled:
+            execution_time = time.perf_counter() - start_time
+            try:
+                cloud_type = self._creds.cloud_type
+                execution = log_execution(
+                    model_name=model_name,
+                    engine_used='duckdb',
+                    execution_time_seconds=execution_time,
+                    rows_processed=_row_count(result),
+                    cloud_type=cloud_type,
+                )
+                if execution.savings > 0.01:  # Only show if meaningful
+                    # list.append is atomic; the total is printed once at cleanup
+                    self._run_savings.append(execution.savings)
+                    console.debug_lazy(
+                        lambda: f"Saved ${execution.savings:.2f} by running {model_name} locally"
+                    )
+            except Exception:
+                pass  # Don't fail the query if logging fails
         
         # Convert to agate table
-        table = self._result_to_agate(result)
+        table = self._result_to_agate(result, description)
         
         return "OK (Local)", table
     
     def _execute_cloud(
         self,
-        model: Dict[str, Any],
+        ctx: "ModelCtx",
         sql: str,
-        config: Dict[str, Any],
+        fetch_results: bool = True,
     ) -> Tuple[str, agate.Table]:
         """
         Execute model on cloud warehouse with Iceberg output.
@@ -317,84 +556,73 @@ class IcebreakerAdapter(SQLAdapter):
         3. Log execution (no savings, but track for analytics)
         4. Return results
         """
-        from dbt.adapters.icebreaker.bridge import (
-            Bridge,
-            IcebergConfig,
-            CatalogRegistrar,
-        )
-        
-        model_name = model.get("name", "unknown")
-        start_time = time.time()
-        credentials = self.config.credentials
-        cloud_type = getattr(credentials, 'cloud_type', 'snowflake') or 'snowflake'
+        model_name = ctx.name
+        config = ctx.config
+        start_time = time.perf_counter()
+        creds = self._creds
+        cloud_type = creds.cloud_type
         
         # Get model identifiers
-        schema = model.get("schema", "public")
-        table = model.get("alias", model.get("name", "unnamed"))
+        schema = ctx.schema
+        table = ctx.alias
         
         # Check if we should wrap in Iceberg DDL
         use_iceberg = config.get("icebreaker_iceberg", True)
-        cloud_bridge_type = getattr(credentials, 'cloud_bridge_type', None)
-        
-        if use_iceberg and cloud_bridge_type:
+        if use_iceberg and creds.cloud_bridge_type:
             # Build Iceberg configuration
             iceberg_config = IcebergConfig(
                 schema=schema,
                 table=table,
-                catalog_integration=getattr(credentials, 'cloud_bridge_catalog_integration', None),
-                external_volume=getattr(credentials, 'cloud_bridge_external_volume', None),
+                catalog_integration=creds.catalog_integration,
+                external_volume=creds.external_volume,
                 partition_by=config.get("partition_by"),
             )
             
             # Wrap SQL in Iceberg DDL
-            bridge = Bridge(cloud_bridge_type, credentials)
-            wrapped_sql = bridge.construct_iceberg_ddl(sql, iceberg_config)
+            wrapped_sql = self._bridge.construct_iceberg_ddl(sql, iceberg_config)
             
             # Execute on cloud
             self.connections.set_engine("cloud")
             response, result = self.connections.execute(wrapped_sql, fetch=False)
             
             # Log execution (cloud run, no savings)
-            execution_time = time.time() - start_time
-            try:
-                log_execution(
-                    model_name=model_name,
-                    engine_used=cloud_type,
-                    execution_time_seconds=execution_time,
-                    rows_processed=0,
-                    cloud_type=cloud_type,
-                )
-            except Exception as e:
-                console.debug(f"Savings logging failed: {e}")
+            if self._telemetry_enabled:
+                execution_time = time.perf_counter() - start_time
+                try:
+                    log_execution(
+                        model_name=model_name,
+                        engine_used=cloud_type,
+                        execution_time_seconds=execution_time,
+                        rows_processed=0,
+                        cloud_type=cloud_type,
+                    )
+                except Exception as e:
+                    console.debug(f"Savings logging failed: {e}")
             
-            # Refresh catalog if configured
-            catalog_type = getattr(credentials, 'catalog_type', None)
-            if catalog_type:
-                registrar = CatalogRegistrar(
-                    catalog_type=catalog_type,
-                    catalog_uri=getattr(credentials, 'catalog_uri', None),
-                )
-                registrar.refresh_table(schema, table)
+            # Refresh catalog if configured; queued so the whole run's tables
+            # are refreshed together at cleanup
+            if self._catalog_registrar is not None:
+                self._pending_refreshes.append((schema, table))
             
             return f"OK (Cloud → Iceberg: {schema}.{table})", agate.Table([])
         else:
             # Direct cloud execution (no Iceberg wrapping)
             self.connections.set_engine("cloud")
-            response, result = self.connections.execute(sql, fetch=True)
+            response, result = self.connections.execute(sql, fetch=fetch_results)
             
             # Log execution (cloud run, no savings)
-            execution_time = time.time() - start_time
-            rows = len(result) if result else 0
-            try:
-                log_execution(
-                    model_name=model_name,
-                    engine_used=cloud_type,
-                    execution_time_seconds=execution_time,
-                    rows_processed=rows,
-                    cloud_type=cloud_type,
-                )
-            except Exception as e:
-                console.debug(f"Savings logging failed: {e}")
+            if self._telemetry_enabled:
+                execution_time = time.perf_counter() - start_time
+                try:
+                    log_execution(
+                        model_name=model_name,
+                        engine_used=cloud_type,
+                        execution_time_seconds=execution_time,
+                        rows_processed=_row_count(result),
+                        cloud_type=cloud_type,
+                    )
+                except Exception as e:
+                    console.debug(f"Savings logging failed: {e}")
             
             table_result = self._result_to_agate(result)
             
@@ -410,24 +638,39 @@ class IcebreakerAdapter(SQLAdapter):
         
         # Simple approach: wrap in subquery with LIMIT
         # More sophisticated approach would use USING SAMPLE
-        if "LIMIT" not in sql.upper():
+        if not _LIMIT_RE.search(sql):
             return f"SELECT * FROM ({sql}) AS __sampled LIMIT {sample_size}"
         return sql
     
-    def _result_to_agate(self, result: Any) -> agate.Table:
-        """Convert query result to agate table."""
+    def _result_to_agate(self, result: Any, description: Optional[Sequence] = None) -> agate.Table:
+        """Convert query result to agate table, typed from the cursor description if given."""
         if result is None:
             return agate.Table([])
         
+        # dbt's execute() already built a typed agate table from the cursor
+        if isinstance(result, agate.Table):
+            return result
+        
+        # Arrow result: keep the column types instead of casting all to Text
+        if hasattr(result, "schema") and hasattr(result, "to_pydict"):
+            column_types = [_agate_type_for_arrow(f.type) for f in result.schema]
+            # Positional, not to_pydict(): that keys by name and drops repeated columns
+            rows = list(zip(*(column.to_pylist() for column in result.columns)))
+            return agate.Table(rows, result.column_names, column_types)
+        
         # Simple conversion - result is a list of tuples
         if isinstance(result, list):
             if len(result) == 0:
                 return agate.Table([])
             
-            # Use generic column names if we don't have metadata
-            num_cols = len(result[0]) if result else 0
-            column_names = [f"col_{i}" for i in range(num_cols)]
-            column_types = [agate.Text()] * num_cols
+            num_cols = len(result[0])
+            if description and len(description) == num_cols:
+                column_names = [col[0] for col in description]
+                column_types = [_agate_type_for_duckdb(col[1]) for col in description]
+            else:
+                # Use generic column names if we don't have metadata
+                column_names = [f"col_{i}" for i in range(num_cols)]
+                column_types = [agate.Text()] * num_cols
             
             return agate.Table(result, column_names, column_types)
         
@@ -437,31 +680,91 @@ class IcebreakerAdapter(SQLAdapter):
     # Required Adapter Methods
     # =========================================================================
     
-    def get_columns_in_relation(self, relation: BaseRelation) -> List[Any]:
-        """Get column information for a relation."""
+    def execute(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        fetch: bool = False,
+        limit: Optional[int] = None,
+    ):
+        """Execute SQL from macros, dropping cached catalog data on anything but a read."""
+        if not _READ_ONLY_SQL.match(sql):
+            self._invalidate_catalog()
+        return super().execute(sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
+    
+    def _fetch_bound(self, sql: str, bindings: tuple) -> List[tuple]:
+        """Run a parameterized read on DuckDB and return all rows."""
+        self.connections.set_engine("duckdb")
+        _, cursor = self.connections.add_query(sql, auto_begin=False, bindings=bindings)
+        return cursor.fetchall() if cursor is not None else []
+    
+    def _invalidate_catalog(self) -> None:
+        """Forget cached schemas/relations/columns after anything that may change them."""
+        if self._catalog_cache:
+            self._catalog_cache = {}
+        if self._schema_exists_cache:
+            self._schema_exists_cache = {}
+    
+    def _schema_catalog(
+        self,
+        schema: str,
+        refresh: bool = False,
+    ) -> Dict[str, Tuple[str, List[tuple]]]:
+        """
+        All relations and their columns in a schema, from one catalog query.
+        
+        Cached per schema so list_relations_without_caching and every
+        get_columns_in_relation call in that schema share one scan instead
+        of issuing a query per relation.
+        """
+        catalog = None if refresh else self._catalog_cache.get(schema)
+        if catalog is not None:
+            return catalog
+        
+        catalog = {}
+        for table_name, table_type, column_name, data_type, nullable, default in (
+            self._fetch_bound(_SCHEMA_CATALOG_SQL, (schema,))
+        ):
+            _, columns = catalog.setdefault(table_name, (table_type, []))
+            if column_name is not None:
+                # Same shape as a DESCRIBE row
+                columns.append((column_name, data_type, nullable, None, default, None))
+        
+        self._catalog_cache[schema] = catalog
+        return catalog
+    
+    def get_columns_in_relation(self, relation: BaseRelation) -> List[tuple]:
+        """
+        Get column information for a relation.
+        
+        Both paths return DESCRIBE-shaped tuples: (column_name, column_type,
+        null, key, default, extra).
+        """
+        if relation.schema and relation.identifier:
+            try:
+                entry = self._schema_catalog(relation.schema).get(relation.identifier)
+                if entry is not None:
+                    return list(entry[1])
+            except Exception:
+                pass  # Fall back to DESCRIBE
+        
         # Use DuckDB to introspect
         sql = f"DESCRIBE {relation}"
         self.connections.set_engine("duckdb")
         try:
             _, result = self.connections.execute(sql, fetch=True)
-            return result or []
+            return [tuple(row) for row in result] if result else []
         except Exception:
             return []
     
     def list_relations_without_caching(self, schema_relation: BaseRelation) -> List[BaseRelation]:
         """List all relations in a schema."""
-        # DuckDB catalog query
-        sql = f"""
-        SELECT table_name, table_type
-        FROM information_schema.tables
-        WHERE table_schema = '{schema_relation.schema}'
-        """
-        self.connections.set_engine("duckdb")
         try:
-            _, result = self.connections.execute(sql, fetch=True)
+            # Always re-scan here; the columns it brings back serve later
+            # get_columns_in_relation calls for this schema
+            catalog = self._schema_catalog(schema_relation.schema, refresh=True)
             relations = []
-            for row in (result or []):
-                table_name, table_type = row[0], row[1]
+            for table_name, (table_type, _) in catalog.items():
                 rel_type = RelationType.Table if table_type == "BASE TABLE" else RelationType.View
                 relations.append(
                     self.Relation.create(
@@ -475,35 +778,84 @@ class IcebreakerAdapter(SQLAdapter):
         except Exception:
             return []
     
-    def create_schema(self, relation: BaseRelation) -> None:
-        """Create a schema."""
-        sql = f"CREATE SCHEMA IF NOT EXISTS {relation.schema}"
+    @available
+    def begin_ddl_batch(self) -> bool:
+        """
+        Start buffering this thread's DDL; see ddl_batch().
+        
+        Returns False if a batch is already open, in which case the caller
+        joins it and must not flush it.
+        """
+        if getattr(self._ddl_state, "pending", None) is not None:
+            return False
+        self._ddl_state.pending = []
+        return True
+    
+    @available
+    def flush_ddl_batch(self) -> None:
+        """Send this thread's buffered DDL as one script and close the batch."""
+        pending = getattr(self._ddl_state, "pending", None)
+        self._ddl_state.pending = None
+        if not pending:
+            return
+        self.connections.set_engine("duckdb")
+        try:
+            self.connections.execute_many(pending)
+        finally:
+            # Lookups made while the DDL was buffered cached the old catalog
+            self._invalidate_catalog()
+    
+    @contextmanager
+    def ddl_batch(self):
+        """
+        Buffer DDL issued in this block and send it as one script on exit.
+        
+        create_schema/drop_*/truncate_relation/rename_relation append to the
+        buffer instead of executing, so N statements cost one round-trip on
+        MotherDuck. Nested windows join the outer one; if the block raises,
+        the buffered DDL is discarded. Materializations use the same buffer
+        through begin_ddl_batch()/flush_ddl_batch().
+        """
+        if not self.begin_ddl_batch():
+            yield
+            return
+        
+        try:
+            yield
+        except BaseException:
+            self._ddl_state.pending = None
+            raise
+        self.flush_ddl_batch()
+    
+    def _run_ddl(self, sql: str) -> None:
+        """Execute a DDL statement on DuckDB, or buffer it inside ddl_batch()."""
+        self._invalidate_catalog()
+        pending = getattr(self._ddl_state, "pending", None)
+        if pending is not None:
+            pending.append(sql)
+            return
         self.connections.set_engine("duckdb")
         self.connections.execute(sql)
     
+    def create_schema(self, relation: BaseRelation) -> None:
+        """Create a schema."""
+        self._run_ddl(f"CREATE SCHEMA IF NOT EXISTS {relation.schema}")
+    
     def drop_schema(self, relation: BaseRelation) -> None:
         """Drop a schema."""
-        sql = f"DROP SCHEMA IF EXISTS {relation.schema} CASCADE"
-        self.connections.set_engine("duckdb")
-        self.connections.execute(sql)
+        self._run_ddl(f"DROP SCHEMA IF EXISTS {relation.schema} CASCADE")
     
     def drop_relation(self, relation: BaseRelation) -> None:
         """Drop a relation."""
-        sql = f"DROP TABLE IF EXISTS {relation}"
-        self.connections.set_engine("duckdb")
-        self.connections.execute(sql)
+        self._run_ddl(f"DROP TABLE IF EXISTS {relation}")
     
     def truncate_relation(self, relation: BaseRelation) -> None:
         """Truncate a relation."""
-        sql = f"DELETE FROM {relation}"
-        self.connections.set_engine("duckdb")
-        self.connections.execute(sql)
+        self._run_ddl(f"DELETE FROM {relation}")
     
     def rename_relation(self, from_relation: BaseRelation, to_relation: BaseRelation) -> None:
         """Rename a relation."""
-        sql = f"ALTER TABLE {from_relation} RENAME TO {to_relation.identifier}"
-        self.connections.set_engine("duckdb")
-        self.connections.execute(sql)
+        self._run_ddl(f"ALTER TABLE {from_relation} RENAME TO {to_relation.identifier}")
     
     @classmethod
     def is_cancelable(cls) -> bool:
@@ -525,5 +877,11 @@ class IcebreakerAdapter(SQLAdapter):
     
     def check_schema_exists(self, database: str, schema: str) -> bool:
         """Check if a schema exists."""
-        schemas = self.list_schemas(database)
-        return schema in schemas
+        exists = self._schema_exists_cache.get(schema)
+        if exists is None:
+            try:
+                exists = bool(self._fetch_bound(_SCHEMA_EXISTS_SQL, (schema,)))
+            except Exception:
+                return False
+            self._schema_exists_cache[schema] = exists
+        return exists
@@ -6,8 +6,12 @@ and routing to cloud when local memory is insufficient.
 """
 
 import re
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Optional
 
 # Try to import psutil for system memory info
 try:
@@ -17,7 +21,101 @@ except ImportError:
     HAS_PSUTIL = False
 
 
-@dataclass
+# psutil.virtual_memory() reads /proc/meminfo; models checked back to back
+# within this window share one reading
+_VMEM_TTL_SECONDS = 0.25
+_vmem_cache: Dict[str, Any] = {"ts": 0.0, "val": None}
+
+
+def _cached_vmem() -> Any:
+    """psutil.virtual_memory(), re-read at most once per _VMEM_TTL_SECONDS."""
+    now = time.monotonic()
+    if _vmem_cache["val"] is None or now - _vmem_cache["ts"] > _VMEM_TTL_SECONDS:
+        _vmem_cache["val"] = psutil.virtual_memory()
+        _vmem_cache["ts"] = now
+    return _vmem_cache["val"]
+
+
+# Every SQL feature the guard looks at, found in one scan of the upper-cased
+# text. JOIN and SELECT are word-bounded, so any whitespace (rendered SQL
+# often breaks the line after JOIN) counts and identifiers like selected_at
+# don't; CROSS is a lookahead so the JOIN after it is still counted.
+_FEATURE_RE = re.compile(
+    r"(?P<join>\bJOIN\b)"
+    r"|(?P<cross>CROSS(?=\s+JOIN\b))"
+    r"|(?P<select>\bSELECT\b)"
+    r"|(?P<window>OVER\s*\()"
+    r"|(?P<heavy>CUBE|ROLLUP|GROUPING SETS)"
+    r"|(?P<limit>LIMIT\s+(?P<limit_value>\d+))"
+    r"|(?P<filter>WHERE|BETWEEN|DATE|[<>])"
+)
+_HEAVY_KEYWORDS = ("CUBE", "ROLLUP", "GROUPING SETS")
+
+# Memory multiplier on input size, by complexity category
+_COMPLEXITY_MULTIPLIERS = MappingProxyType({
+    "simple": 1.2,   # Just need to hold data + output
+    "medium": 1.5,   # Intermediate buffers for JOINs
+    "complex": 2.5,  # Multiple intermediate results
+    "heavy": 4.0,    # Window functions, cubes need full dataset
+})
+
+# Pre-flight warning level -> display marker
+_LEVEL_MARKERS = MappingProxyType({"BLOCKER": "BLOCK", "WARNING": "WARN", "INFO": "INFO"})
+
+
+# Distinct SQL texts whose features are kept; repeated renders of the same
+# model (re-runs, tests) skip the scan
+FEATURE_CACHE_SIZE = 1024
+
+
+@dataclass(slots=True, frozen=True)
+class _SqlFeatures:
+    """SQL traits used for memory estimation, from a single pass over the query."""
+    join_count: int = 0
+    window_count: int = 0
+    select_count: int = 0
+    heavy_ops: FrozenSet[str] = frozenset()
+    has_cross_join: bool = False
+    has_filter: bool = False
+    limit: Optional[int] = None  # first LIMIT value, if any
+    
+    @property
+    def subquery_count(self) -> int:
+        return self.select_count - 1
+
+
+@lru_cache(maxsize=FEATURE_CACHE_SIZE)
+def _extract_features(sql: str) -> _SqlFeatures:
+    """Upper-case the SQL once and collect every feature in one regex pass."""
+    counts = {"join": 0, "select": 0, "window": 0}
+    heavy_ops = set()
+    has_cross_join = has_filter = False
+    limit = None
+    for match in _FEATURE_RE.finditer(sql.upper()):
+        kind = match.lastgroup
+        if kind in counts:
+            counts[kind] += 1
+        elif kind == "filter":
+            has_filter = True
+        elif kind == "heavy":
+            heavy_ops.add(match.group())
+        elif kind == "cross":
+            has_cross_join = True
+        elif kind == "limit" and limit is None:
+            limit = int(match.group("limit_value"))
+    # Frozen: the cached instance is shared by every caller with this SQL
+    return _SqlFeatures(
+        join_count=counts["join"],
+        window_count=counts["window"],
+        select_count=counts["select"],
+        heavy_ops=frozenset(heavy_ops),
+        has_cross_join=has_cross_join,
+        has_filter=has_filter,
+        limit=limit,
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class MemoryEstimate:
     """Memory estimate for a query."""
     estimated_gb: float
@@ -85,17 +183,21 @@ class MemoryGuard:
         Returns:
             MemoryEstimate with safety determination
         """
+        return self._check(_extract_features(sql), input_size_gb)
+    
+    def _check(self, features: _SqlFeatures, input_size_gb: float) -> MemoryEstimate:
+        """check_query on already-extracted SQL features."""
         # Get current available memory
         if HAS_PSUTIL:
-            mem = psutil.virtual_memory()
+            mem = _cached_vmem()
             available_gb = mem.available / (1024 ** 3)
         else:
             # Conservative estimate if psutil unavailable
             available_gb = self.system_memory_gb * 0.5
         
         # Estimate query memory requirements
-        complexity = self._analyze_complexity(sql)
-        estimated_gb = self._estimate_memory(sql, input_size_gb, complexity)
+        complexity = self._analyze_complexity(features)
+        estimated_gb = self._estimate_memory(features, input_size_gb, complexity)
         
         # Determine if safe to run
         effective_available = available_gb - self.min_available_gb
@@ -106,10 +208,10 @@ class MemoryGuard:
             available_gb=available_gb,
             safe_to_run=safe_to_run,
             complexity=complexity,
-            details=self._get_details(sql, complexity),
+            details=self._get_details(features),
         )
     
-    def _analyze_complexity(self, sql: str) -> str:
+    def _analyze_complexity(self, features: _SqlFeatures) -> str:
         """
         Analyze SQL complexity for memory estimation.
         
@@ -119,32 +221,19 @@ class MemoryGuard:
         - complex: Multiple JOINs + aggregations
         - heavy: Window functions, CUBE, ROLLUP, etc.
         """
-        sql_upper = sql.upper()
-        
         # Heavy operations
-        if any(kw in sql_upper for kw in ["CUBE", "ROLLUP", "GROUPING SETS"]):
+        if features.heavy_ops:
             return "heavy"
         
         # Window functions (expensive)
-        window_count = len(re.findall(r"OVER\s*\(", sql_upper))
+        window_count = features.window_count
         if window_count > 3:
             return "heavy"
-        elif window_count > 0:
-            # Has window functions but not too many
-            pass
-        
-        # Count JOINs
-        join_count = sql_upper.count(" JOIN ")
         
-        # Count aggregations
-        agg_count = sum(1 for agg in ["COUNT(", "SUM(", "AVG(", "MAX(", "MIN("]
-                       if agg in sql_upper)
-        
-        # Count subqueries
-        subquery_count = sql_upper.count("SELECT") - 1
+        join_count = features.join_count
         
         # Classify
-        if join_count > 4 or subquery_count > 3:
+        if join_count > 4 or features.subquery_count > 3:
             return "complex"
         elif join_count > 0 or window_count > 0:
             return "medium"
@@ -153,7 +242,7 @@ class MemoryGuard:
     
     def _estimate_memory(
         self,
-        sql: str,
+        features: _SqlFeatures,
         input_size_gb: float,
         complexity: str,
     ) -> float:
@@ -163,30 +252,22 @@ class MemoryGuard:
         Uses complexity-based multipliers on input size.
         """
         # Base multiplier by complexity
-        multipliers = {
-            "simple": 1.2,   # Just need to hold data + output
-            "medium": 1.5,   # Intermediate buffers for JOINs
-            "complex": 2.5,  # Multiple intermediate results
-            "heavy": 4.0,    # Window functions, cubes need full dataset
-        }
-        multiplier = multipliers.get(complexity, 2.0)
+        multiplier = _COMPLEXITY_MULTIPLIERS.get(complexity, 2.0)
         
         # If we don't know input size, estimate from SQL
         if input_size_gb <= 0:
             # Use heuristics based on query patterns
-            sql_upper = sql.upper()
             
             # Check for LIMIT clauses (reduces memory)
-            limit_match = re.search(r"LIMIT\s+(\d+)", sql_upper)
-            if limit_match:
-                limit = int(limit_match.group(1))
+            limit = features.limit
+            if limit is not None:
                 if limit < 10000:
                     return 0.1  # Very small result
                 elif limit < 100000:
                     return 0.5
             
             # Check for date filters (likely filtered data)
-            if any(kw in sql_upper for kw in ["WHERE", "BETWEEN", "DATE", ">", "<"]):
+            if features.has_filter:
                 return 1.0 * multiplier
             
             # Unknown - use conservative estimate
@@ -194,41 +275,21 @@ class MemoryGuard:
         
         return input_size_gb * multiplier
     
-    def _get_details(self, sql: str, complexity: str) -> str:
+    def _get_details(self, features: _SqlFeatures) -> str:
         """Get human-readable details about the analysis."""
-        sql_upper = sql.upper()
-        
-        details = []
-        
-        # JOINs
-        join_count = sql_upper.count(" JOIN ")
-        if join_count > 0:
-            details.append(f"{join_count} JOIN(s)")
-        
-        # Window functions
-        window_count = len(re.findall(r"OVER\s*\(", sql_upper))
-        if window_count > 0:
-            details.append(f"{window_count} window function(s)")
-        
-        # Subqueries
-        subquery_count = sql_upper.count("SELECT") - 1
-        if subquery_count > 0:
-            details.append(f"{subquery_count} subquery/CTE(s)")
-        
-        # Heavy ops
-        for op in ["CUBE", "ROLLUP", "GROUPING SETS"]:
-            if op in sql_upper:
-                details.append(op)
-        
-        if not details:
-            details.append("Simple query")
-        
-        return ", ".join(details)
+        subquery_count = features.subquery_count
+        details = ", ".join(filter(None, (
+            f"{features.join_count} JOIN(s)" if features.join_count > 0 else "",
+            f"{features.window_count} window function(s)" if features.window_count > 0 else "",
+            f"{subquery_count} subquery/CTE(s)" if subquery_count > 0 else "",
+            *(op for op in _HEAVY_KEYWORDS if op in features.heavy_ops),
+        )))
+        return details or "Simple query"
     
     def get_system_info(self) -> Dict[str, Any]:
         """Get current system memory information."""
         if HAS_PSUTIL:
-            mem = psutil.virtual_memory()
+            mem = _cached_vmem()
             return {
                 "total_gb": mem.total / (1024 ** 3),
                 "available_gb": mem.available / (1024 ** 3),
@@ -246,7 +307,7 @@ class MemoryGuard:
             }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PreFlightWarning:
     """A pre-flight check warning."""
     level: str  # INFO, WARNING, BLOCKER
@@ -289,10 +350,11 @@ class PreFlightChecker:
         """
         warnings = []
         
+        # One scan of the SQL feeds the memory check and the pattern checks
+        features = _extract_features(sql)
+        
         # Memory check
-        mem_estimate = self.memory_guard.check_query(
-            sql, input_size_gb, self.catalog, model
-        )
+        mem_estimate = self.memory_guard._check(features, input_size_gb)
         
         if not mem_estimate.safe_to_run:
             warnings.append(PreFlightWarning(
@@ -319,20 +381,18 @@ class PreFlightChecker:
             ))
         
         # Check for potentially slow patterns
-        sql_upper = sql.upper()
-        
-        if "CROSS JOIN" in sql_upper:
+        if features.has_cross_join:
             warnings.append(PreFlightWarning(
                 level="WARNING",
                 category="sql",
                 message="CROSS JOIN detected - may produce very large result",
             ))
         
-        if sql_upper.count("SELECT") > 5:
+        if features.select_count > 5:
             warnings.append(PreFlightWarning(
                 level="INFO",
                 category="sql",
-                message=f"Query has {sql_upper.count('SELECT')} SELECT statements",
+                message=f"Query has {features.select_count} SELECT statements",
             ))
         
         # Check for missing dependencies (would need manifest)
@@ -345,14 +405,14 @@ class PreFlightChecker:
         if not warnings:
             return "All pre-flight checks passed"
         
-        lines = ["Pre-flight checks:"]
-        for w in warnings:
-            marker = {"BLOCKER": "BLOCK", "WARNING": "WARN", "INFO": "INFO"}.get(w.level, "-")
-            lines.append(f"  [{marker}] [{w.category}] {w.message}")
-            if w.recommendation:
-                lines.append(f"       -> {w.recommendation}")
-        
-        return "\n".join(lines)
+        return "\n".join(chain(
+            ("Pre-flight checks:",),
+            chain.from_iterable(
+                (f"  [{_LEVEL_MARKERS.get(w.level, '-')}] [{w.category}] {w.message}",)
+                + ((f"       -> {w.recommendation}",) if w.recommendation else ())
+                for w in warnings
+            ),
+        ))
 
 
 # =============================================================================
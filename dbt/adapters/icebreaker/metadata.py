@@ -11,13 +11,29 @@ Supports:
 """
 
 import json
+import time
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from dbt.adapters.icebreaker.console import console
 
+# Optional fast JSON codec for the stats cache
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Query-history rows fetched per round-trip when harvesting
+_HARVEST_BATCH_SIZE = 1000
+
+# Pulls the model name out of a /* ... model=<name> ... */ statement comment
+# in Databricks query history; the query's LIKE prefilter must stay in step
+_DATABRICKS_MODEL_RE = r"/\*.*model=([^,\*]+).*\*/"
+
 
 @dataclass
 class MetadataConfig:
@@ -31,9 +47,9 @@ class MetadataConfig:
     cache_ttl_hours: int = 24
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelStats:
-    """Execution statistics for a model."""
+    """Execution statistics for a model; shared by every reader, so immutable."""
     model_name: str
     avg_seconds: float = 0.0
     avg_spill_bytes: float = 0.0
@@ -42,6 +58,18 @@ class ModelStats:
     last_run: Optional[str] = None
 
 
+def _stats_from_cache(model_name: str, model_data: Dict[str, Any]) -> ModelStats:
+    """Build ModelStats from one model's entry in the stats cache."""
+    return ModelStats(
+        model_name=model_name,
+        avg_seconds=model_data.get("avg_seconds", 0),
+        avg_spill_bytes=model_data.get("avg_spill_bytes", 0),
+        avg_rows_produced=model_data.get("avg_rows_produced", 0),
+        run_count=model_data.get("run_count", 0),
+        last_run=model_data.get("last_run"),
+    )
+
+
 class MetadataHarvester:
     """
     Harvests execution telemetry from cloud warehouses.
@@ -54,14 +82,16 @@ class MetadataHarvester:
     def __init__(self, config: Optional[MetadataConfig] = None):
         self.config = config or MetadataConfig()
         self._cache: Optional[Dict] = None
+        # (fetched_at string, monotonic time it goes stale); parsed once per fetch
+        self._stale_at: Optional[Tuple[str, float]] = None
     
     @property
     def cache_file(self) -> Path:
         return self.config.state_dir / "cloud_stats.json"
     
-    @property
+    @cached_property
     def cache(self) -> Dict:
-        """Load or initialize cache."""
+        """Load or initialize cache; later reads hit the instance dict directly."""
         if self._cache is None:
             self._load_cache()
         return self._cache
@@ -70,8 +100,11 @@ class MetadataHarvester:
         """Load stats cache from disk."""
         if self.cache_file.exists():
             try:
-                self._cache = json.loads(self.cache_file.read_text())
-            except (json.JSONDecodeError, IOError):
+                if HAS_ORJSON:
+                    self._cache = orjson.loads(self.cache_file.read_bytes())
+                else:
+                    self._cache = json.loads(self.cache_file.read_text())
+            except (json.JSONDecodeError, IOError):  # orjson's error subclasses it
                 self._cache = self._default_cache()
         else:
             self._cache = self._default_cache()
@@ -87,7 +120,12 @@ class MetadataHarvester:
     def _save_cache(self) -> None:
         """Save cache to disk."""
         self.config.state_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file.write_text(json.dumps(self._cache, indent=2, default=str))
+        if HAS_ORJSON:
+            self.cache_file.write_bytes(
+                orjson.dumps(self._cache, option=orjson.OPT_INDENT_2, default=str)
+            )
+        else:
+            self.cache_file.write_text(json.dumps(self._cache, indent=2, default=str))
     
     def is_stale(self) -> bool:
         """Check if cache needs refresh."""
@@ -95,12 +133,18 @@ class MetadataHarvester:
         if not fetched_at:
             return True
         
-        try:
-            last_fetch = datetime.fromisoformat(fetched_at)
-            age = datetime.now() - last_fetch
-            return age > timedelta(hours=self.config.cache_ttl_hours)
-        except (ValueError, TypeError):
-            return True
+        stale_at = self._stale_at
+        if stale_at is None or stale_at[0] != fetched_at:
+            try:
+                age = datetime.now() - datetime.fromisoformat(fetched_at)
+            except (ValueError, TypeError):
+                return True
+            ttl = timedelta(hours=self.config.cache_ttl_hours)
+            stale_at = self._stale_at = (
+                fetched_at,
+                time.monotonic() + (ttl - age).total_seconds(),
+            )
+        return time.monotonic() > stale_at[1]
     
     # =========================================================================
     # Query Generation
@@ -126,7 +170,7 @@ WHERE START_TIME > DATEADD('day', -{self.config.history_days}, CURRENT_TIMESTAMP
 AND QUERY_TAG LIKE '%"model"%'
 AND EXECUTION_STATUS = 'SUCCESS'
 GROUP BY 1
-HAVING model_name IS NOT NULL
+HAVING model_name IS NOT NULL AND model_name != ''
 """
     
     def get_bigquery_query(self, project_id: str) -> str:
@@ -155,11 +199,13 @@ GROUP BY 1
         """
         Databricks query for system.query_history.
         
-        Requires comment with model name in SQL.
+        Requires comment with model name in SQL, e.g. /* model=orders */.
+        Statements without such a comment are dropped by a LIKE prefilter
+        before the regex extract runs.
         """
         return f"""
 SELECT
-    regexp_extract(statement_text, '/\\*.*model=([^,\\*]+).*\\*/', 1) AS model_name,
+    regexp_extract(statement_text, '{_DATABRICKS_MODEL_RE}', 1) AS model_name,
     AVG(total_elapsed_time_ms / 1000) AS avg_seconds,
     AVG(rows_produced) AS avg_rows_produced,
     COUNT(*) AS run_count,
@@ -167,6 +213,7 @@ SELECT
 FROM system.query_history
 WHERE start_time > NOW() - INTERVAL {self.config.history_days} DAY
 AND status = 'SUCCESS'
+AND statement_text LIKE '%/*%model=%*/%'
 GROUP BY 1
 HAVING model_name IS NOT NULL AND model_name != ''
 """
@@ -190,19 +237,19 @@ HAVING model_name IS NOT NULL AND model_name != ''
         try:
             cursor = connection.cursor()
             cursor.execute(query)
-            rows = cursor.fetchall()
             
+            # Stream in batches rather than buffering the whole result
             stats = {}
-            for row in rows:
-                model_name = row[0]
-                if model_name:
+            while rows := cursor.fetchmany(_HARVEST_BATCH_SIZE):
+                for model_name, seconds, spill, rows_produced, runs, last_run in rows:
+                    # HAVING already drops rows without a model name
                     stats[model_name] = ModelStats(
                         model_name=model_name,
-                        avg_seconds=float(row[1] or 0),
-                        avg_spill_bytes=float(row[2] or 0),
-                        avg_rows_produced=float(row[3] or 0),
-                        run_count=int(row[4] or 0),
-                        last_run=str(row[5]) if row[5] else None,
+                        avg_seconds=float(seconds or 0),
+                        avg_spill_bytes=float(spill or 0),
+                        avg_rows_produced=float(rows_produced or 0),
+                        run_count=int(runs or 0),
+                        last_run=str(last_run) if last_run else None,
                     )
             
             return stats
@@ -228,43 +275,40 @@ HAVING model_name IS NOT NULL AND model_name != ''
             "fetched_at": datetime.now().isoformat(),
             "source": source,
         }
+        # Drop the memoized cache and stats so the next read sees the new dict
+        self.__dict__.pop("cache", None)
+        self.__dict__.pop("_model_stats", None)
         self._save_cache()
     
     # =========================================================================
     # Access Methods
     # =========================================================================
     
+    @cached_property
+    def _model_stats(self) -> Dict[str, ModelStats]:
+        """ModelStats for every cached model, built once per cache load."""
+        return {
+            name: _stats_from_cache(name, model_data)
+            for name, model_data in self.cache.get("models", {}).items()
+            if model_data
+        }
+    
     def get_model_stats(self, model_name: str) -> Optional[ModelStats]:
         """Get stats for a specific model."""
-        model_data = self.cache.get("models", {}).get(model_name)
-        if not model_data:
-            return None
-        
-        return ModelStats(
-            model_name=model_name,
-            avg_seconds=model_data.get("avg_seconds", 0),
-            avg_spill_bytes=model_data.get("avg_spill_bytes", 0),
-            avg_rows_produced=model_data.get("avg_rows_produced", 0),
-            run_count=model_data.get("run_count", 0),
-            last_run=model_data.get("last_run"),
-        )
+        return self._model_stats.get(model_name)
     
     def get_all_stats(self) -> Dict[str, ModelStats]:
         """Get stats for all models."""
-        result = {}
-        for name in self.cache.get("models", {}).keys():
-            stats = self.get_model_stats(name)
-            if stats:
-                result[name] = stats
-        return result
+        return dict(self._model_stats)
     
     def get_slow_models(self, threshold_seconds: float = 600) -> List[str]:
         """Get list of models that exceed runtime threshold."""
-        slow = []
-        for name, stats in self.get_all_stats().items():
-            if stats.avg_seconds > threshold_seconds:
-                slow.append(name)
-        return slow
+        # Filter on the raw cache entries; no ModelStats for models we discard
+        return [
+            name
+            for name, model_data in self.cache.get("models", {}).items()
+            if model_data and model_data.get("avg_seconds", 0) > threshold_seconds
+        ]
 
 
 # Singleton
@@ -47,6 +47,15 @@ class IcebreakerRelation(BaseRelation):
     def render(self) -> str:
         """Render the relation for DuckDB SQL without database prefix."""
         # For DuckDB: just schema.identifier (no database)
+        include, quote = self.include_policy, self.quote_policy
+        if (
+            self.schema and self.identifier
+            and include.schema and include.identifier
+            and not quote.schema and not quote.identifier
+        ):
+            # Default policies: one f-string, no parts list or per-component lookups
+            return f"{self.schema}.{self.identifier}"
+        
         parts = []
         
         if self.include_policy.schema and self.schema:
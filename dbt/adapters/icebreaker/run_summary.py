@@ -5,21 +5,29 @@ Tracks routing decisions and execution metrics during a dbt run,
 then generates a clear summary showing where models ran and cost savings.
 """
 
+import io
 import os
 import json
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from dbt.adapters.icebreaker.console import console
 
+# Optional fast JSON encoder for session files
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # =============================================================================
 # Run Session Tracking
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelExecution:
     """Track a single model's execution."""
     name: str
@@ -40,7 +48,7 @@ class ModelExecution:
         return 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RunSession:
     """Track an entire dbt run session."""
     session_id: str
@@ -48,30 +56,41 @@ class RunSession:
     ended_at: str = ""
     models: List[ModelExecution] = field(default_factory=list)
     total_models: int = 0
+    # Running aggregates, updated by add_model so the summary never rescans models
+    local_count: int = field(default=0, init=False)
+    cloud_count: int = field(default=0, init=False)
+    success_count: int = field(default=0, init=False)
+    error_count: int = field(default=0, init=False)
+    total_duration: float = field(default=0.0, init=False)
+    total_savings: float = field(default=0.0, init=False)
+    # reason -> model count, in first-seen order, and the failed executions
+    reason_counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    errors: List[ModelExecution] = field(default_factory=list, init=False, repr=False)
+    # asdict() of models[:len(_model_dicts)], so each model is converted once
+    _model_dicts: List[dict] = field(default_factory=list, init=False, repr=False)
     
-    @property
-    def local_count(self) -> int:
-        return sum(1 for m in self.models if m.venue == "LOCAL")
-    
-    @property
-    def cloud_count(self) -> int:
-        return sum(1 for m in self.models if m.venue == "CLOUD")
+    def add_model(self, execution: ModelExecution) -> None:
+        """Record a model execution and fold it into the running totals."""
+        self.models.append(execution)
+        self.total_models = len(self.models)
+        if execution.venue == "LOCAL":
+            self.local_count += 1
+        elif execution.venue == "CLOUD":
+            self.cloud_count += 1
+        if execution.success:
+            self.success_count += 1
+        else:
+            self.error_count += 1
+            self.errors.append(execution)
+        self.reason_counts[execution.reason] = self.reason_counts.get(execution.reason, 0) + 1
+        self.total_duration += execution.duration_seconds
+        self.total_savings += execution.savings
     
-    @property
-    def success_count(self) -> int:
-        return sum(1 for m in self.models if m.success)
-    
-    @property
-    def error_count(self) -> int:
-        return sum(1 for m in self.models if not m.success)
-    
-    @property
-    def total_duration(self) -> float:
-        return sum(m.duration_seconds for m in self.models)
-    
-    @property
-    def total_savings(self) -> float:
-        return sum(m.savings for m in self.models)
+    def model_dicts(self) -> List[dict]:
+        """Models as plain dicts, converting only those added since the last call."""
+        converted = self._model_dicts
+        converted.extend(asdict(m) for m in self.models[len(converted):])
+        return converted
 
 
 # =============================================================================
@@ -98,6 +117,8 @@ class RunSummary:
         self.data_dir = data_dir or os.path.expanduser("~/.icebreaker/runs")
         Path(self.data_dir).mkdir(parents=True, exist_ok=True)
         self._session: Optional[RunSession] = None
+        # (session, model count, text) of the last format_summary() result
+        self._summary_cache: Optional[Tuple[RunSession, int, str]] = None
     
     @property
     def session_file(self) -> str:
@@ -140,8 +161,7 @@ class RunSummary:
             estimated_cloud_cost=estimated_cloud_cost,
             started_at=datetime.now().isoformat(),
         )
-        self._session.models.append(execution)
-        self._session.total_models = len(self._session.models)
+        self._session.add_model(execution)
     
     def end_session(self):
         """End the current session."""
@@ -157,10 +177,16 @@ class RunSummary:
                 "started_at": self._session.started_at,
                 "ended_at": self._session.ended_at,
                 "total_models": self._session.total_models,
-                "models": [asdict(m) for m in self._session.models],
             }
-            with open(self.session_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if HAS_ORJSON:
+                # orjson serializes the ModelExecution dataclasses natively
+                data["models"] = self._session.models
+                with open(self.session_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                data["models"] = self._session.model_dicts()
+                with open(self.session_file, 'w') as f:
+                    json.dump(data, f, indent=2)
     
     def format_summary(self, colorize: bool = True) -> str:
         """
@@ -172,57 +198,55 @@ class RunSummary:
             return "No run session active."
         
         s = self._session
-        lines = []
+        # Unchanged since the last call: same session, no models logged since
+        cached = self._summary_cache
+        if cached is not None and cached[0] is s and cached[1] == len(s.models):
+            return cached[2]
+        
+        buf = io.StringIO()
+        w = buf.write
         
         # Header
-        lines.append("")
-        lines.append("=" * 60)
-        lines.append("ICEBREAKER RUN SUMMARY")
-        lines.append("=" * 60)
-        lines.append("")
+        w("\n" + "=" * 60 + "\nICEBREAKER RUN SUMMARY\n" + "=" * 60 + "\n\n")
         
         # Stats overview
         local_pct = (s.local_count / max(len(s.models), 1)) * 100
-        lines.append(f"Models: {len(s.models)} total")
-        lines.append(f"  Local (FREE):  {s.local_count} ({local_pct:.0f}%)")
-        lines.append(f"  Cloud:         {s.cloud_count}")
-        lines.append(f"  Succeeded:     {s.success_count}")
+        w(f"Models: {len(s.models)} total\n")
+        w(f"  Local (FREE):  {s.local_count} ({local_pct:.0f}%)\n")
+        w(f"  Cloud:         {s.cloud_count}\n")
+        w(f"  Succeeded:     {s.success_count}\n")
         if s.error_count > 0:
-            lines.append(f"  Failed:        {s.error_count}")
-        lines.append("")
+            w(f"  Failed:        {s.error_count}\n")
+        w("\n")
         
         # Savings
-        lines.append(f"Estimated Savings: ${s.total_savings:.2f}")
-        lines.append(f"Total Duration:    {s.total_duration:.1f}s")
-        lines.append("")
+        w(f"Estimated Savings: ${s.total_savings:.2f}\n")
+        w(f"Total Duration:    {s.total_duration:.1f}s\n\n")
         
         # Routing breakdown by reason
-        reason_counts: Dict[str, int] = {}
-        for m in s.models:
-            reason_counts[m.reason] = reason_counts.get(m.reason, 0) + 1
-        
+        reason_counts = s.reason_counts
         if reason_counts:
-            lines.append("Routing Breakdown:")
+            w("Routing Breakdown:\n")
             for reason, count in sorted(reason_counts.items(), key=lambda x: -x[1]):
-                lines.append(f"  {reason}: {count}")
-            lines.append("")
+                w(f"  {reason}: {count}\n")
+            w("\n")
         
         # Show errors if any
-        errors = [m for m in s.models if not m.success]
+        errors = s.errors
         if errors:
-            lines.append("Errors:")
+            w("Errors:\n")
             for m in errors[:5]:  # Show max 5
-                lines.append(f"  - {m.name}: {m.error or 'Unknown error'}")
+                w(f"  - {m.name}: {m.error or 'Unknown error'}\n")
             if len(errors) > 5:
-                lines.append(f"  ... and {len(errors) - 5} more")
-            lines.append("")
+                w(f"  ... and {len(errors) - 5} more\n")
+            w("\n")
         
         # Footer
-        lines.append("=" * 60)
-        lines.append("Run 'icebreaker savings' for detailed cost analysis")
-        lines.append("")
+        w("=" * 60 + "\nRun 'icebreaker savings' for detailed cost analysis\n")
         
-        return "\n".join(lines)
+        summary = buf.getvalue()
+        self._summary_cache = (s, len(s.models), summary)
+        return summary
     
     def get_last_session(self) -> Optional[Dict]:
         """Load the most recent session from disk."""
@@ -5,14 +5,26 @@ Tracks query executions and calculates cost savings from running locally vs clou
 Stores data locally (no cloud storage needed - completely private).
 """
 
+import atexit
+import io
 import json
 import os
 import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, astuple
+from typing import List, Optional
 
 from dbt.adapters.icebreaker.console import console
 
+# Optional fast JSON encoder for exports
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # Default cost assumptions based on actual cloud pricing (2024/2025)
 # Users can override these in profiles.yml under icebreaker.cost_config
@@ -58,6 +70,20 @@ class QueryExecution:
     estimated_cloud_cost: float  # What it WOULD have cost on cloud
     actual_cost: float  # What it actually cost (0 for DuckDB)
     savings: float  # Difference
+    ts: int = 0  # Unix epoch microseconds; what range queries filter on
+
+
+_INSERT_EXECUTION_SQL = """
+    INSERT INTO executions 
+    (timestamp, model_name, engine_used, execution_time_seconds, 
+     rows_processed, bytes_processed, estimated_cloud_cost, actual_cost, savings, ts)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Executions logged but not yet written; flushed in one transaction so a run
+# costs one commit (and one fsync) instead of one per model
+_pending: List[QueryExecution] = []
+_pending_lock = threading.Lock()
 
 
 def get_db_path() -> str:
@@ -68,32 +94,113 @@ def get_db_path() -> str:
     return os.path.join(icebreaker_dir, "savings.db")
 
 
+# One connection per process, shared by every read and write below
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.RLock()
+
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MB
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Open (once) and return the tuned savings database connection."""
+    global _conn
+    with _conn_lock:
+        if _conn is None:
+            conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            _conn = conn
+        return _conn
+
+
+def _close_conn() -> None:
+    """Close the shared connection, checkpointing the WAL back into the database."""
+    global _conn
+    with _conn_lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+
+
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS executions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        model_name TEXT NOT NULL,
+        engine_used TEXT NOT NULL,
+        execution_time_seconds REAL,
+        rows_processed INTEGER,
+        bytes_processed INTEGER,
+        estimated_cloud_cost REAL,
+        actual_cost REAL,
+        savings REAL,
+        ts INTEGER
+    );
+"""
+
+# Run after the migration so `ts` exists on databases created before it.
+# `timestamp` is kept for display only; range filters all go through idx_ts
+_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_ts ON executions(ts);
+    DROP INDEX IF EXISTS idx_timestamp;
+"""
+
+
+def _has_ts_column(conn: sqlite3.Connection) -> bool:
+    return any(row[1] == "ts" for row in conn.execute("PRAGMA table_info(executions)"))
+
+
+def _migrate_ts(conn: sqlite3.Connection) -> None:
+    """Add and backfill the integer `ts` column on databases that predate it."""
+    if _has_ts_column(conn):
+        return
+    # Re-check under the write lock: another process opening the same old
+    # database may have migrated it while we waited, and a second ALTER
+    # would fail with "duplicate column name"
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if not _has_ts_column(conn):
+            conn.execute("ALTER TABLE executions ADD COLUMN ts INTEGER")
+            # Stored timestamps are naive local time; 'utc' converts them to epoch
+            conn.execute(
+                "UPDATE executions "
+                "SET ts = CAST(strftime('%s', timestamp, 'utc') AS INTEGER) * 1000000"
+            )
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+# Set once the schema exists; the DDL runs at most once per process
+_INITIALIZED = False
+_init_lock = threading.Lock()
+
+
+def _ensure_init() -> None:
+    """Create the schema on first use; a flag check on every later call."""
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    with _init_lock:
+        if not _INITIALIZED:
+            conn = _get_conn()
+            with _conn_lock:
+                conn.executescript(_SCHEMA_SQL)
+                _migrate_ts(conn)
+                conn.executescript(_INDEX_SQL)
+            _INITIALIZED = True
+
+
 def init_db():
-    """Initialize the savings database."""
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS executions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            model_name TEXT NOT NULL,
-            engine_used TEXT NOT NULL,
-            execution_time_seconds REAL,
-            rows_processed INTEGER,
-            bytes_processed INTEGER,
-            estimated_cloud_cost REAL,
-            actual_cost REAL,
-            savings REAL
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_timestamp ON executions(timestamp)
-    """)
-    
-    conn.commit()
-    conn.close()
+    """Initialize the savings database. Safe to call repeatedly."""
+    _ensure_init()
 
 
 def log_execution(
@@ -118,8 +225,6 @@ def log_execution(
     Returns:
         QueryExecution with calculated savings
     """
-    init_db()
-    
     # Estimate what cloud cost would have been
     estimated_cloud_cost = estimate_cloud_cost(
         cloud_type=cloud_type,
@@ -134,8 +239,9 @@ def log_execution(
     # Savings
     savings = estimated_cloud_cost - actual_cost
     
+    now = time.time()
     execution = QueryExecution(
-        timestamp=datetime.now().isoformat(),
+        timestamp=datetime.fromtimestamp(now).isoformat(),
         model_name=model_name,
         engine_used=engine_used,
         execution_time_seconds=execution_time_seconds,
@@ -144,33 +250,52 @@ def log_execution(
         estimated_cloud_cost=estimated_cloud_cost,
         actual_cost=actual_cost,
         savings=savings,
+        ts=int(now * 1_000_000),
     )
     
-    # Store in database
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO executions 
-        (timestamp, model_name, engine_used, execution_time_seconds, 
-         rows_processed, bytes_processed, estimated_cloud_cost, actual_cost, savings)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        execution.timestamp,
-        execution.model_name,
-        execution.engine_used,
-        execution.execution_time_seconds,
-        execution.rows_processed,
-        execution.bytes_processed,
-        execution.estimated_cloud_cost,
-        execution.actual_cost,
-        execution.savings,
-    ))
-    conn.commit()
-    conn.close()
+    # Buffered; written by flush_pending()
+    with _pending_lock:
+        _pending.append(execution)
     
     return execution
 
 
+def flush_pending() -> int:
+    """
+    Write all buffered executions to the database in one transaction.
+    
+    Called at the end of a run, at interpreter exit, and before reads so
+    reports include this process's executions. If the write fails the
+    records stay buffered for the next call.
+    
+    Returns:
+        Number of executions written
+    """
+    global _pending
+    with _pending_lock:
+        pending, _pending = _pending, []
+    if not pending:
+        return 0
+    
+    try:
+        _ensure_init()
+        conn = _get_conn()
+        with _conn_lock, conn:
+            conn.executemany(_INSERT_EXECUTION_SQL, [astuple(e) for e in pending])
+    except sqlite3.Error as e:
+        # Keep the records, ahead of any logged meanwhile, for the next flush
+        with _pending_lock:
+            _pending = pending + _pending
+        console.warn(f"Could not save {len(pending)} savings record(s), will retry: {e}")
+        return 0
+    return len(pending)
+
+
+# atexit runs handlers last-in first-out: flush first, then close
+atexit.register(_close_conn)
+atexit.register(flush_pending)
+
+
 def estimate_cloud_cost(
     cloud_type: str,
     execution_time_seconds: float,
@@ -229,6 +354,35 @@ def format_savings_amount(amount: float) -> str:
         return f"${amount:.2f}"
 
 
+_TOP_MODELS_SQL = """
+    SELECT 
+        model_name,
+        COUNT(*) as runs,
+        SUM(savings) as model_savings
+    FROM executions
+    WHERE ts > ? AND engine_used IN ('duckdb', 'local')
+    GROUP BY model_name
+    ORDER BY model_savings DESC
+    LIMIT 5
+"""
+
+
+def _epoch_us(dt: datetime) -> int:
+    """Local datetime as Unix epoch microseconds, the unit of the `ts` column."""
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _period_cutoff(period: str) -> int:
+    """Epoch microseconds that executions in a report period come after."""
+    if period == "today":
+        return _epoch_us(datetime.now().replace(hour=0, minute=0, second=0, microsecond=0))
+    elif period == "week":
+        return _epoch_us(datetime.now() - timedelta(days=7))
+    elif period == "month":
+        return _epoch_us(datetime.now() - timedelta(days=30))
+    return 0
+
+
 def get_savings_summary(
     period: str = "all",  # "today", "week", "month", "all"
 ) -> dict:
@@ -243,20 +397,14 @@ def get_savings_summary(
         - total_time_saved: Seconds saved (local is faster)
         - top_models: Models with most savings
     """
-    init_db()
+    flush_pending()
+    _ensure_init()
     
-    conn = sqlite3.connect(get_db_path())
+    conn = _get_conn()
     cursor = conn.cursor()
     
     # Calculate time filter
-    if period == "today":
-        cutoff = datetime.now().replace(hour=0, minute=0, second=0).isoformat()
-    elif period == "week":
-        cutoff = (datetime.now() - timedelta(days=7)).isoformat()
-    elif period == "month":
-        cutoff = (datetime.now() - timedelta(days=30)).isoformat()
-    else:
-        cutoff = "1900-01-01"
+    cutoff = _period_cutoff(period)
     
     # Get summary stats
     cursor.execute("""
@@ -267,31 +415,19 @@ def get_savings_summary(
             COALESCE(SUM(savings), 0) as total_savings,
             COALESCE(SUM(execution_time_seconds), 0) as total_time
         FROM executions
-        WHERE timestamp > ?
+        WHERE ts > ?
     """, (cutoff,))
     
     row = cursor.fetchone()
     
     # Get top models by savings
-    cursor.execute("""
-        SELECT 
-            model_name,
-            COUNT(*) as runs,
-            SUM(savings) as model_savings
-        FROM executions
-        WHERE timestamp > ? AND engine_used IN ('duckdb', 'local')
-        GROUP BY model_name
-        ORDER BY model_savings DESC
-        LIMIT 5
-    """, (cutoff,))
+    cursor.execute(_TOP_MODELS_SQL, (cutoff,))
     
     top_models = [
         {"model": r[0], "runs": r[1], "savings": r[2]}
         for r in cursor.fetchall()
     ]
     
-    conn.close()
-    
     return {
         "period": period,
         "total_queries": row[0] or 0,
@@ -303,6 +439,38 @@ def get_savings_summary(
     }
 
 
+# Fixed opening sections of the reports, filled with str.format
+_REPORT_HEADER = (
+    "\n"
+    "ICEBREAKER SAVINGS REPORT\n"
+    + "=" * 40 + "\n"
+    "Period: {period_name}\n"
+    "\n"
+    "Total Saved: ${total_savings:.2f}\n"
+    "\n"
+    "Query Stats:\n"
+    "  Total queries:  {total_queries:,}\n"
+    "  Run locally:    {local_queries:,} (FREE)\n"
+    "  Run on cloud:   {cloud_queries:,}\n"
+    "\n"
+)
+
+_DASHBOARD_HEADER = (
+    "\n"
+    "ICEBREAKER SAVINGS DASHBOARD\n"
+    + "=" * 55 + "\n"
+    "\n"
+    "  Today:       ${today[total_savings]:>8.2f}  ({today[local_queries]:>4} local queries)\n"
+    "  This Week:   ${week[total_savings]:>8.2f}  ({week[local_queries]:>4} local queries)\n"
+    "  This Month:  ${month[total_savings]:>8.2f}  ({month[local_queries]:>4} local queries)\n"
+    "\n"
+    + "-" * 55 + "\n"
+    "  Projected Annual Savings: ${projected:,.0f}\n"
+    + "-" * 55 + "\n"
+    "\n"
+)
+
+
 def format_savings_report(summary: dict) -> str:
     """Format savings summary as a nice report."""
     period_name = {
@@ -312,151 +480,181 @@ def format_savings_report(summary: dict) -> str:
         "all": "All Time",
     }.get(summary["period"], summary["period"])
     
-    lines = [
-        "",
-        "ICEBREAKER SAVINGS REPORT",
-        "=" * 40,
-        f"Period: {period_name}",
-        "",
-        f"Total Saved: ${summary['total_savings']:.2f}",
-        "",
-        "Query Stats:",
-        f"  Total queries:  {summary['total_queries']:,}",
-        f"  Run locally:    {summary['local_queries']:,} (FREE)",
-        f"  Run on cloud:   {summary['cloud_queries']:,}",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(_REPORT_HEADER.format(
+        period_name=period_name,
+        total_savings=summary['total_savings'],
+        total_queries=summary['total_queries'],
+        local_queries=summary['local_queries'],
+        cloud_queries=summary['cloud_queries'],
+    ))
     
     if summary["local_queries"] > 0:
         pct_local = (summary["local_queries"] / summary["total_queries"]) * 100
-        lines.append(f"  Local rate:     {pct_local:.1f}%")
+        w(f"  Local rate:     {pct_local:.1f}%\n")
     
     if summary["top_models"]:
-        lines.extend([
-            "",
-            "Top Savings by Model:",
-        ])
+        w("\nTop Savings by Model:\n")
         for i, model in enumerate(summary["top_models"], 1):
-            lines.append(
+            w(
                 f"  {i}. {model['model']}: ${model['savings']:.2f} "
-                f"({model['runs']} runs)"
+                f"({model['runs']} runs)\n"
             )
     
-    lines.extend([
-        "",
-        "=" * 40,
-        "Keep running locally to save more!",
-        "",
-    ])
-    
-    return "\n".join(lines)
+    w("\n" + "=" * 40 + "\nKeep running locally to save more!\n")
+    return buf.getvalue()
 
 
 def get_weekly_trend() -> dict:
     """Get savings trend for the last 7 days."""
-    init_db()
-    conn = sqlite3.connect(get_db_path())
+    flush_pending()
+    _ensure_init()
+    conn = _get_conn()
     cursor = conn.cursor()
     
+    now = datetime.now()
+    dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(6, -1, -1)]
+    
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=6)
+    
+    # One grouped range scan over idx_ts; days are labelled from the local ISO
+    # timestamp so they match the local dates above
+    cursor.execute("""
+        SELECT 
+            substr(timestamp, 1, 10) AS day,
+            COALESCE(SUM(savings), 0),
+            COUNT(*)
+        FROM executions
+        WHERE ts >= ?
+        GROUP BY day
+    """, (_epoch_us(start),))
+    by_day = {day: (savings, queries) for day, savings, queries in cursor.fetchall()}
+    
     days = []
-    for i in range(7):
-        date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-        cursor.execute("""
-            SELECT 
-                COALESCE(SUM(savings), 0),
-                COUNT(*)
-            FROM executions
-            WHERE date(timestamp) = ?
-        """, (date,))
-        row = cursor.fetchone()
+    for date in dates:
+        savings, queries = by_day.get(date, (0, 0))
         days.append({
             "date": date,
-            "savings": row[0],
-            "queries": row[1],
+            "savings": savings,
+            "queries": queries,
         })
     
-    conn.close()
-    return {"days": list(reversed(days))}
+    return {"days": days}
 
 
 def get_projected_annual_savings() -> float:
     """Project annual savings based on recent activity."""
-    init_db()
-    conn = sqlite3.connect(get_db_path())
+    flush_pending()
+    _ensure_init()
+    conn = _get_conn()
     cursor = conn.cursor()
     
     # Get last 30 days average
-    cutoff = (datetime.now() - timedelta(days=30)).isoformat()
     cursor.execute("""
         SELECT COALESCE(SUM(savings), 0)
         FROM executions
-        WHERE timestamp > ?
-    """, (cutoff,))
+        WHERE ts > ?
+    """, (_period_cutoff("month"),))
     monthly_savings = cursor.fetchone()[0] or 0
-    conn.close()
     
     # Project to annual
     return monthly_savings * 12
 
 
+_DASHBOARD_PERIODS = ("today", "week", "month")
+
+# Per-period totals for the dashboard via conditional aggregation; one scan
+# of the month window serves all three periods
+_DASHBOARD_TOTALS_SQL = """
+    WITH c(today, week, month) AS (SELECT ?, ?, ?)
+    SELECT 
+        {columns}
+    FROM executions, c
+    WHERE ts > c.month
+""".format(columns=",\n        ".join(
+    f"SUM(CASE WHEN ts > c.{p} THEN 1 ELSE 0 END), "
+    f"SUM(CASE WHEN ts > c.{p} AND engine_used IN ('duckdb', 'local') "
+    f"THEN 1 ELSE 0 END), "
+    f"COALESCE(SUM(CASE WHEN ts > c.{p} THEN savings END), 0)"
+    for p in _DASHBOARD_PERIODS
+))
+
+
+def _get_dashboard_summaries() -> dict:
+    """
+    Today/week/month summaries for the dashboard from one aggregate query.
+    
+    Each summary has total_queries, local_queries and total_savings; the
+    month summary also carries top_models.
+    """
+    flush_pending()
+    _ensure_init()
+    cursor = _get_conn().cursor()
+    
+    cutoffs = [_period_cutoff(p) for p in _DASHBOARD_PERIODS]
+    cursor.execute(_DASHBOARD_TOTALS_SQL, cutoffs)
+    row = cursor.fetchone()
+    
+    summaries = {}
+    for i, period in enumerate(_DASHBOARD_PERIODS):
+        total, local, savings = row[3 * i:3 * i + 3]
+        summaries[period] = {
+            "period": period,
+            "total_queries": total or 0,
+            "local_queries": local or 0,
+            "total_savings": savings or 0.0,
+            "top_models": [],
+        }
+    
+    cursor.execute(_TOP_MODELS_SQL, (cutoffs[-1],))
+    summaries["month"]["top_models"] = [
+        {"model": r[0], "runs": r[1], "savings": r[2]}
+        for r in cursor.fetchall()
+    ]
+    
+    return summaries
+
+
 def format_enhanced_savings_report() -> str:
     """Generate the enhanced savings dashboard."""
     # Get summaries for different periods
-    today = get_savings_summary("today")
-    week = get_savings_summary("week")
-    month = get_savings_summary("month")
+    summaries = _get_dashboard_summaries()
+    today, week, month = (summaries[p] for p in _DASHBOARD_PERIODS)
     
-    # Get trends and projections
+    # Get trends and projections; the month window is the projection's basis
     trend = get_weekly_trend()
-    projected = get_projected_annual_savings()
-    
-    lines = [
-        "",
-        "ICEBREAKER SAVINGS DASHBOARD",
-        "=" * 55,
-        "",
-        f"  Today:       ${today['total_savings']:>8.2f}  ({today['local_queries']:>4} local queries)",
-        f"  This Week:   ${week['total_savings']:>8.2f}  ({week['local_queries']:>4} local queries)",
-        f"  This Month:  ${month['total_savings']:>8.2f}  ({month['local_queries']:>4} local queries)",
-        "",
-        "-" * 55,
-        f"  Projected Annual Savings: ${projected:,.0f}",
-        "-" * 55,
-        "",
-    ]
+    projected = month["total_savings"] * 12
+    
+    buf = io.StringIO()
+    w = buf.write
+    w(_DASHBOARD_HEADER.format(today=today, week=week, month=month, projected=projected))
     
     # Weekly sparkline
     if any(d['savings'] > 0 for d in trend['days']):
-        lines.append("  Last 7 Days:")
+        w("  Last 7 Days:\n")
         max_savings = max(d['savings'] for d in trend['days']) or 1
         for day in trend['days']:
             bar_len = int((day['savings'] / max_savings) * 20) if max_savings > 0 else 0
             bar = "#" * bar_len
             date_short = day['date'][5:]  # MM-DD
-            lines.append(f"     {date_short} |{bar:<20} ${day['savings']:.2f}")
-        lines.append("")
+            w(f"     {date_short} |{bar:<20} ${day['savings']:.2f}\n")
+        w("\n")
     
     # Top models
     if month['top_models']:
-        lines.append("  Top Models by Savings (This Month):")
+        w("  Top Models by Savings (This Month):\n")
         for i, model in enumerate(month['top_models'][:5], 1):
-            lines.append(
-                f"     {i}. {model['model']:<25} ${model['savings']:>8.2f}"
-            )
-        lines.append("")
+            w(f"     {i}. {model['model']:<25} ${model['savings']:>8.2f}\n")
+        w("\n")
     
     # Local rate
     if month['total_queries'] > 0:
         rate = (month['local_queries'] / month['total_queries']) * 100
-        lines.append(f"  Local Execution Rate: {rate:.0f}%")
-        lines.append("")
+        w(f"  Local Execution Rate: {rate:.0f}%\n\n")
     
-    lines.extend([
-        "=" * 55,
-        "",
-    ])
-    
-    return "\n".join(lines)
+    w("=" * 55 + "\n")
+    return buf.getvalue()
 
 
 def print_savings(period: str = "all"):
@@ -487,8 +685,12 @@ def export_to_json(filepath: str = None) -> str:
         "projected_annual": get_projected_annual_savings(),
     }
     
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    if HAS_ORJSON:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(data, f, indent=2)
     
     return filepath
 
@@ -6,13 +6,72 @@ and fallback execution. Reads credentials from dbt profiles.yml
 and supports RSA key-pair authentication.
 """
 
+import atexit
 import os
+import threading
 import yaml
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from dbt.adapters.icebreaker.console import console
 
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# (path, mtime) of every candidate profiles.yml -> resolved icebreaker output
+_resolved_profile: Optional[Tuple[tuple, Optional[Dict[str, Any]]]] = None
+
+
+@lru_cache(maxsize=4)
+def _load_profiles(path: str, mtime: float) -> Any:
+    """Parse a profiles.yml; mtime is part of the key so edits are picked up."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _profiles_paths() -> List[str]:
+    """Candidate profiles.yml locations, in dbt's search order."""
+    profiles_paths = []
+    
+    # Check DBT_PROFILES_DIR env var first
+    env_dir = os.environ.get("DBT_PROFILES_DIR")
+    if env_dir:
+        profiles_paths.append(os.path.join(env_dir, "profiles.yml"))
+    
+    # Current directory
+    profiles_paths.append(os.path.join(os.getcwd(), "profiles.yml"))
+    
+    # Default ~/.dbt/
+    profiles_paths.append(os.path.expanduser("~/.dbt/profiles.yml"))
+    return profiles_paths
+
+
+def _icebreaker_output(profiles: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the first icebreaker-typed output in a parsed profiles.yml."""
+    # Look for icebreaker_dev or any profile with type: icebreaker
+    for profile_name, profile_config in profiles.items():
+        if not isinstance(profile_config, dict):
+            continue
+        
+        outputs = profile_config.get("outputs", {})
+        target_name = profile_config.get("target", "dev")
+        
+        # Check each output for icebreaker type
+        for output_name, output_config in outputs.items():
+            if not isinstance(output_config, dict):
+                continue
+            if output_config.get("type") == "icebreaker":
+                return output_config
+        
+        # Also check the default target
+        if target_name in outputs:
+            target_config = outputs[target_name]
+            if isinstance(target_config, dict) and target_config.get("type") == "icebreaker":
+                return target_config
+    return None
+
+
 def find_icebreaker_profile() -> Optional[Dict[str, Any]]:
     """
     Find and return the icebreaker profile configuration from profiles.yml.
@@ -23,61 +82,88 @@ def find_icebreaker_profile() -> Optional[Dict[str, Any]]:
     3. ~/.dbt/profiles.yml
     
     Returns the target output dict (e.g., account, database, schema, etc.)
-    or None if not found.
+    or None if not found. The result is reused until one of the candidate
+    files is created, removed or modified.
     """
-    profiles_paths = []
-    
-    # Check DBT_PROFILES_DIR env var first
-    env_dir = os.environ.get("DBT_PROFILES_DIR")
-    if env_dir:
-        profiles_paths.append(os.path.join(env_dir, "profiles.yml"))
+    global _resolved_profile
     
-    # Current directory
-    profiles_paths.append(os.path.join(os.getcwd(), "profiles.yml"))
+    candidates = []
+    for path in _profiles_paths():
+        try:
+            candidates.append((path, os.stat(path).st_mtime))
+        except OSError:
+            continue
+    key = tuple(candidates)
+    if _resolved_profile is not None and _resolved_profile[0] == key:
+        return _resolved_profile[1]
     
-    # Default ~/.dbt/
-    profiles_paths.append(os.path.expanduser("~/.dbt/profiles.yml"))
+    had_error = False
+    result = None
+    for path, mtime in candidates:
+        try:
+            profiles = _load_profiles(path, mtime)
+            if not profiles:
+                continue
+            result = _icebreaker_output(profiles)
+            if result is not None:
+                break
+        except Exception as e:
+            console.warn(f"Could not read profiles from {path}: {e}")
+            had_error = True
+            continue
     
-    for path in profiles_paths:
-        if os.path.exists(path):
+    # Don't pin a result that came from skipping an unreadable file
+    if not had_error:
+        _resolved_profile = (key, result)
+    return result
+
+
+# Process-wide Snowflake connection; one login per process, not per caller
+_sf_conn: Optional[Any] = None
+_sf_lock = threading.Lock()
+
+
+def _close_snowflake_connection() -> None:
+    """Close the shared Snowflake connection, if one was opened."""
+    global _sf_conn
+    with _sf_lock:
+        if _sf_conn is not None:
             try:
-                with open(path, "r") as f:
-                    profiles = yaml.safe_load(f)
-                
-                if not profiles:
-                    continue
-                
-                # Look for icebreaker_dev or any profile with type: icebreaker
-                for profile_name, profile_config in profiles.items():
-                    if not isinstance(profile_config, dict):
-                        continue
-                    
-                    outputs = profile_config.get("outputs", {})
-                    target_name = profile_config.get("target", "dev")
-                    
-                    # Check each output for icebreaker type
-                    for output_name, output_config in outputs.items():
-                        if not isinstance(output_config, dict):
-                            continue
-                        if output_config.get("type") == "icebreaker":
-                            return output_config
-                    
-                    # Also check the default target
-                    if target_name in outputs:
-                        target_config = outputs[target_name]
-                        if isinstance(target_config, dict) and target_config.get("type") == "icebreaker":
-                            return target_config
-                
-            except Exception as e:
-                console.warn(f"Could not read profiles from {path}: {e}")
-                continue
+                _sf_conn.close()
+            except Exception:
+                pass
+            _sf_conn = None
+
+
+atexit.register(_close_snowflake_connection)
+
+
+@lru_cache(maxsize=2)
+def _load_private_key(key_path: str, mtime: float, passphrase: Optional[str]) -> bytes:
+    """Decrypt a PEM private key to PKCS8 DER bytes, once per key file version."""
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
     
-    return None
+    with open(key_path, "rb") as key_file:
+        p_key = serialization.load_pem_private_key(
+            key_file.read(),
+            password=passphrase.encode() if passphrase else None,
+            backend=default_backend(),
+        )
+    
+    return p_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
 
 
 def get_snowflake_connection() -> Optional[Any]:
     """
-    Create a Snowflake connection using credentials from the icebreaker profile.
+    Return the shared Snowflake connection, connecting on first use.
+    
+    The connection is reused for the rest of the process and re-established
+    if it has been closed.
     
     Supports:
     - RSA key-pair authentication (private_key_path)
@@ -86,6 +172,21 @@ def get_snowflake_connection() -> Optional[Any]:
     
     Returns a snowflake.connector connection object, or None if unavailable.
     """
+    global _sf_conn
+    with _sf_lock:
+        if _sf_conn is not None:
+            try:
+                if not _sf_conn.is_closed():
+                    return _sf_conn
+            except Exception:
+                pass
+            _sf_conn = None
+        _sf_conn = _connect_snowflake()
+        return _sf_conn
+
+
+def _connect_snowflake() -> Optional[Any]:
+    """Open a new Snowflake connection from the icebreaker profile."""
     try:
         import snowflake.connector
     except ImportError:
@@ -137,22 +238,11 @@ def get_snowflake_connection() -> Optional[Any]:
     if private_key_path:
         # RSA key-pair authentication
         try:
-            from cryptography.hazmat.backends import default_backend
-            from cryptography.hazmat.primitives import serialization
-            
             key_path = os.path.expanduser(private_key_path)
-            with open(key_path, "rb") as key_file:
-                passphrase = profile.get("private_key_passphrase")
-                p_key = serialization.load_pem_private_key(
-                    key_file.read(),
-                    password=passphrase.encode() if passphrase else None,
-                    backend=default_backend(),
-                )
-            
-            pkb = p_key.private_bytes(
-                encoding=serialization.Encoding.DER,
-                format=serialization.PrivateFormat.PKCS8,
-                encryption_algorithm=serialization.NoEncryption(),
+            pkb = _load_private_key(
+                key_path,
+                os.stat(key_path).st_mtime,
+                profile.get("private_key_passphrase"),
             )
             connect_kwargs["private_key"] = pkb
         except Exception as e:
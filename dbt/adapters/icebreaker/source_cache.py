@@ -24,6 +24,13 @@ import duckdb
 
 from dbt.adapters.icebreaker.console import console
 
+# Optional fast JSON codec for the cache manifest
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # =============================================================================
 # Configuration
@@ -104,19 +111,30 @@ class SourceCache:
         """Load cache manifest from disk."""
         if os.path.exists(self.manifest_path):
             try:
-                with open(self.manifest_path, 'r') as f:
-                    data = json.load(f)
-                    self._manifest = {
-                        k: CacheEntry(**v) for k, v in data.items()
-                    }
+                if HAS_ORJSON:
+                    data = orjson.loads(Path(self.manifest_path).read_bytes())
+                else:
+                    with open(self.manifest_path, 'r') as f:
+                        data = json.load(f)
+                self._manifest = {
+                    k: CacheEntry(**v) for k, v in data.items()
+                }
             except Exception:
                 self._manifest = {}
     
     def _save_manifest(self):
         """Save cache manifest to disk."""
-        data = {k: asdict(v) for k, v in self._manifest.items()}
-        with open(self.manifest_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write beside the manifest and swap it in, so readers (and a crash
+        # mid-write) never see a truncated file
+        tmp_path = f"{self.manifest_path}.tmp"
+        if HAS_ORJSON:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(self._manifest, option=orjson.OPT_INDENT_2))
+        else:
+            data = {k: asdict(v) for k, v in self._manifest.items()}
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
     
     def get_table_id(self, database: str, schema: str, table: str) -> str:
         """Generate unique table identifier."""
@@ -365,9 +383,11 @@ class SourceCache:
                             writer = pq.ParquetWriter(
                                 parquet_path,
                                 batch.schema,
-                                compression='snappy',
+                                compression='zstd',
+                                compression_level=3,
                             )
-                        writer.write_table(batch)
+                        # Tables or record batches, depending on connector version
+                        writer.write(batch)
                         row_count += batch.num_rows
                 finally:
                     if writer is not None:
@@ -410,6 +430,9 @@ class SourceCache:
             return False
         
         try:
+            # Keep Parquet footers/metadata in memory across the run's queries
+            conn.execute("SET enable_object_cache = true")
+            
             # Create schema if needed
             conn.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
             
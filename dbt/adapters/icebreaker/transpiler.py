@@ -5,7 +5,8 @@ Uses SQLGlot to convert SQL between dialects.
 Primary use case: Snowflake SQL -> DuckDB SQL for local execution.
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 import sqlglot
 from sqlglot import exp
 from sqlglot.errors import ParseError
@@ -19,6 +20,10 @@ DIALECT_MAP = {
 }
 
 
+# Distinct SQL strings remembered per Transpiler instance
+TRANSPILE_CACHE_SIZE = 4096
+
+
 class TranspilationError(Exception):
     """Raised when SQL cannot be transpiled."""
     pass
@@ -33,11 +38,17 @@ class Transpiler:
     
     def __init__(self, source_dialect: str = "snowflake"):
         self.source_dialect = DIALECT_MAP.get(source_dialect, source_dialect)
+        # Per-instance memo of SQL -> DuckDB SQL; the dialect is fixed per
+        # instance, so the SQL text alone is the key. Failures aren't cached.
+        self._transpile_cached = lru_cache(maxsize=TRANSPILE_CACHE_SIZE)(self._transpile)
     
     def to_duckdb(self, sql: str) -> str:
         """
         Convert SQL from source dialect to DuckDB.
         
+        Results are memoized, so re-running identical compiled SQL (e.g.
+        repeated dev runs) skips the SQLGlot parse/generate entirely.
+        
         Args:
             sql: SQL string in the source dialect
             
@@ -51,6 +62,10 @@ class Transpiler:
         if not sql or not sql.strip():
             return ""
         
+        return self._transpile_cached(sql)
+    
+    def _transpile(self, sql: str) -> str:
+        """Uncached parse -> transform -> generate for a single SQL string."""
         try:
             # Parse the SQL
             parsed = sqlglot.parse(sql, dialect=self.source_dialect)
@@ -433,6 +448,26 @@ class Transpiler:
         return found
 
 
+# =============================================================================
+# Shared Instances
+# =============================================================================
+
+_transpilers: Dict[str, Transpiler] = {}
+
+
+def get_transpiler(source_dialect: str = "snowflake") -> Transpiler:
+    """
+    Get the process-wide transpiler for a source dialect.
+    
+    Keeping one long-lived instance per dialect means every model in a
+    run reuses the same warmed-up SQLGlot dialect objects.
+    """
+    transpiler = _transpilers.get(source_dialect)
+    if transpiler is None:
+        transpiler = _transpilers.setdefault(source_dialect, Transpiler(source_dialect))
+    return transpiler
+
+
 def convert_dialect(
     sql: str,
     source: str = "snowflake",
@@ -452,5 +487,4 @@ def convert_dialect(
     if target != "duckdb":
         raise ValueError(f"Only 'duckdb' target is supported, got: {target}")
     
-    transpiler = Transpiler(source_dialect=source)
-    return transpiler.to_duckdb(sql)
+    return get_transpiler(source).to_duckdb(sql)
@@ -44,13 +44,14 @@
     
     {{ run_hooks(pre_hooks) }}
     
-    {# Ensure schema exists #}
-    {% call statement('create_schema') %}
-        CREATE SCHEMA IF NOT EXISTS {{ schema }}
-    {% endcall %}
-    
+    {# Ensure schema exists and drop the old relation in one DDL round-trip #}
+    {%- set owns_ddl_batch = adapter.begin_ddl_batch() -%}
+    {% do adapter.create_schema(target_relation) %}
     {% if old_relation is not none %}
-        {{ adapter.drop_relation(old_relation) }}
+        {% do adapter.drop_relation(old_relation) %}
+    {% endif %}
+    {% if owns_ddl_batch %}
+        {% do adapter.flush_ddl_batch() %}
     {% endif %}
     
     {# Switch engine if needed #}
@@ -2,9 +2,12 @@
 Tests for the Bridge module.
 """
 
+import threading
+
 import pytest
 from dbt.adapters.icebreaker.bridge import (
     Bridge,
+    CatalogRegistrar,
     IcebergConfig,
     CloudProvider,
 )
@@ -141,3 +144,72 @@ class TestIcebergConfig:
         assert config.external_volume == "EXT_VOL"
         assert config.location == "s3://bucket/path"
         assert config.partition_by == "date"
+
+
+class _FakeCatalog:
+    """PyIceberg catalog stand-in recording load_table calls."""
+    
+    def __init__(self, fail=(), barrier=None):
+        self.loaded = []
+        self.fail = set(fail)
+        self.barrier = barrier
+    
+    def load_table(self, table_id):
+        self.loaded.append(table_id)
+        if table_id in self.fail:
+            raise RuntimeError("no such table")
+        return self
+    
+    def refresh(self):
+        if self.barrier is not None:
+            self.barrier.wait()
+
+
+def _registrar(catalog) -> CatalogRegistrar:
+    registrar = CatalogRegistrar(catalog_type="rest", catalog_uri="http://catalog")
+    registrar._catalog = catalog
+    return registrar
+
+
+class TestCatalogRegistrar:
+    """Test cases for refreshing catalog entries after cloud builds."""
+    
+    def test_refresh_tables_dedupes(self):
+        """Each distinct table is loaded and refreshed once."""
+        catalog = _FakeCatalog()
+        
+        results = _registrar(catalog).refresh_tables([
+            ("analytics", "orders"),
+            ("analytics", "customers"),
+            ("analytics", "orders"),
+        ])
+        
+        assert results == {"analytics.orders": True, "analytics.customers": True}
+        assert sorted(catalog.loaded) == ["analytics.customers", "analytics.orders"]
+    
+    def test_refresh_tables_reports_failures_per_table(self):
+        """One failing table does not stop or mask the others."""
+        catalog = _FakeCatalog(fail={"analytics.missing"})
+        
+        results = _registrar(catalog).refresh_tables([
+            ("analytics", "missing"),
+            ("analytics", "orders"),
+        ])
+        
+        assert results == {"analytics.missing": False, "analytics.orders": True}
+    
+    def test_refresh_tables_overlap(self):
+        """Refreshes run concurrently rather than one after another."""
+        # Each refresh waits for the other; run serially they would time out
+        catalog = _FakeCatalog(barrier=threading.Barrier(2, timeout=5))
+        
+        results = _registrar(catalog).refresh_tables([("a", "t1"), ("a", "t2")])
+        
+        assert results == {"a.t1": True, "a.t2": True}
+    
+    def test_refresh_tables_without_catalog(self):
+        """With no catalog available every table reports False."""
+        registrar = CatalogRegistrar(catalog_type="unsupported")
+        
+        assert registrar.refresh_tables([("a", "t1"), ("a", "t1")]) == {"a.t1": False}
+        assert registrar.refresh_tables([]) == {}
@@ -54,3 +54,42 @@ class TestEngineSwitch:
     def test_use_engine_context_manager(self):
         """use_engine should restore previous engine."""
         pass
+
+
+class TestLoadExtensions:
+    """Test cases for DuckDB extension loading."""
+    
+    class _FakeHandle:
+        def __init__(self, status):
+            self.status = status
+            self.executed = []
+        
+        def execute(self, sql):
+            self.executed.append(sql)
+            return self
+        
+        def fetchall(self):
+            return [(name, inst, loaded) for name, (inst, loaded) in self.status.items()]
+    
+    def test_skips_installed_and_loaded(self):
+        """Extensions already installed and loaded should not be re-run."""
+        from dbt.adapters.icebreaker.connections import IcebreakerConnectionManager
+        
+        handle = self._FakeHandle({"httpfs": (True, True)})
+        IcebreakerConnectionManager._load_extensions(handle, ["httpfs"])
+        
+        assert len(handle.executed) == 1  # Only the status query
+    
+    def test_batches_missing_extensions(self):
+        """Missing extensions should be installed/loaded in a single script."""
+        from dbt.adapters.icebreaker.connections import IcebreakerConnectionManager
+        
+        handle = self._FakeHandle({"httpfs": (True, False), "iceberg": (False, False)})
+        IcebreakerConnectionManager._load_extensions(handle, ["httpfs", "iceberg"])
+        
+        assert len(handle.executed) == 2
+        script = handle.executed[1]
+        assert "INSTALL httpfs" not in script
+        assert "LOAD httpfs" in script
+        assert "INSTALL iceberg" in script
+        assert "LOAD iceberg" in script
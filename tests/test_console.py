@@ -0,0 +1,90 @@
+"""
+Tests for the Icebreaker console.
+"""
+
+import io
+import threading
+
+from rich.console import Console as RichConsole
+
+from dbt.adapters.icebreaker.console import DownloadTracker, IcebreakerConsole
+
+
+def _render(tbl) -> str:
+    out = RichConsole(file=io.StringIO(), width=120, color_system=None)
+    out.print(tbl)
+    return out.file.getvalue()
+
+
+class TestTableTemplates:
+    """Test cases for cached table skeletons."""
+    
+    def test_second_table_has_only_its_own_rows(self):
+        """Rows added to one table must not leak into the next."""
+        console = IcebreakerConsole()
+        columns = [("Model", "cyan"), ("Venue", "green")]
+        
+        first = console._table_from_template(columns)
+        first.add_row("orders", "LOCAL")
+        first.add_row("customers", "CLOUD", end_section=True)
+        
+        second = console._table_from_template(columns)
+        second.add_row("payments", "LOCAL")
+        
+        assert first.row_count == 2
+        assert second.row_count == 1
+        assert len(second.rows) == 1
+        assert not second.rows[0].end_section
+        
+        rendered = _render(second)
+        assert "payments" in rendered
+        assert "orders" not in rendered
+        assert "customers" not in rendered
+    
+    def test_template_stays_empty(self):
+        """The cached template is never written to."""
+        console = IcebreakerConsole()
+        columns = [("Model", "cyan")]
+        
+        for name in ("a", "b", "c"):
+            console._table_from_template(columns).add_row(name)
+        
+        template = console._table_cache[tuple(columns)]
+        assert template.rows == []
+        assert all(not column._cells for column in template.columns)
+
+
+class TestDownloadTracker:
+    """Test cases for concurrent download progress."""
+    
+    def test_done_never_exceeds_total(self):
+        """Concurrent start/finish pairs always report done <= total."""
+        tracker = DownloadTracker()
+        results = []
+        
+        def download(i: int) -> None:
+            tracker.start(f"src_{i}")
+            results.append(tracker.finish(f"src_{i}"))
+        
+        threads = [threading.Thread(target=download, args=(i,)) for i in range(50)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert all(done <= total for done, total in results)
+        assert tracker.summary == "50/50 sources"
+    
+    def test_reset_starts_a_new_run(self):
+        """Counts and in-flight downloads are cleared between runs."""
+        tracker = DownloadTracker()
+        tracker.start("a")
+        tracker.finish("a")
+        tracker.start("b")
+        
+        tracker.reset()
+        tracker.start("c")
+        
+        assert tracker.summary == "0/1 sources"
+        assert list(tracker._active) == ["c"]
+        assert tracker.finish("c") == (1, 1)
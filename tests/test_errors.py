@@ -0,0 +1,62 @@
+"""
+Tests for Icebreaker error classes.
+"""
+
+from dbt.adapters.icebreaker.errors import LocalExecutionError
+
+
+class TestLocalExecutionError:
+    """Test cases for local execution suggestions."""
+    
+    def test_out_of_memory_suggests_cloud(self):
+        """Memory errors suggest routing to cloud."""
+        err = LocalExecutionError("big_model", "Out of Memory Error: failed to allocate block")
+        
+        assert "ran out of memory" in err.suggestion
+        assert "icebreaker_route='cloud'" in err.suggestion
+    
+    def test_oom_word_suggests_cloud(self):
+        """A bare OOM marker counts as a memory error."""
+        err = LocalExecutionError("big_model", "process killed (OOM)")
+        
+        assert "ran out of memory" in err.suggestion
+    
+    def test_parser_error_suggests_ansi_sql(self):
+        """Syntax errors suggest cloud routing or ANSI SQL."""
+        err = LocalExecutionError("m", 'Parser Error: syntax error at or near "QUALIFY"')
+        
+        assert "could not parse" in err.suggestion
+    
+    def test_missing_table_suggests_cache_refresh(self):
+        """Missing tables suggest refreshing the source cache."""
+        err = LocalExecutionError("m", "Catalog Error: Table with name orders does not exist!")
+        
+        assert "icebreaker cache refresh" in err.suggestion
+    
+    def test_column_named_like_oom_is_not_memory(self):
+        """Substrings of identifiers must not trigger the memory branch."""
+        err = LocalExecutionError("m", 'Binder Error: Referenced column "room_id" not found')
+        
+        assert "icebreaker cache refresh" in err.suggestion
+        assert "memory" not in err.suggestion
+    
+    def test_memory_takes_priority_over_later_categories(self):
+        """Memory beats parse and missing, even when mentioned later."""
+        err = LocalExecutionError(
+            "m", "Table staging does not exist; parse retry failed: out of memory"
+        )
+        
+        assert "ran out of memory" in err.suggestion
+    
+    def test_parse_takes_priority_over_missing(self):
+        """Parse beats missing regardless of position."""
+        err = LocalExecutionError("m", "column not found while trying to parse expression")
+        
+        assert "could not parse" in err.suggestion
+    
+    def test_unknown_error_has_no_suggestion(self):
+        """Unrecognised errors carry no suggestion."""
+        err = LocalExecutionError("m", "Conversion Error: could not cast value")
+        
+        assert err.suggestion is None
+        assert "Suggestion" not in str(err)
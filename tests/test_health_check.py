@@ -0,0 +1,180 @@
+"""
+Tests for the Health Checker.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import asdict
+from tempfile import TemporaryDirectory
+
+import duckdb
+
+from dbt.adapters.icebreaker.health_check import (
+    HealthChecker,
+    HealthCheckResult,
+    _render_tables,
+    _short_error,
+)
+
+
+class _DuckCloud:
+    """Snowflake-shaped connection backed by DuckDB, recording executed SQL."""
+    
+    def __init__(self, conn):
+        self.conn = conn
+        self.executed = []
+    
+    @contextmanager
+    def cursor(self):
+        outer = self
+        
+        class _Cursor:
+            def execute(self, sql):
+                outer.executed.append(sql)
+                self._result = outer.conn.execute(sql)
+            
+            def fetchall(self):
+                return self._result.fetchall()
+        
+        yield _Cursor()
+
+
+class TestHealthCheckResult:
+    """Test cases for check result serialisation."""
+    
+    def test_result_serialises(self):
+        """Results round-trip through asdict, as_dict and JSON."""
+        result = HealthCheckResult(
+            check_name="Source Cache",
+            status="WARNING",
+            message="3 tables cached (0.0GB), 1 stale",
+            details={"tables": 3, "size_gb": 0.0, "stale": 1},
+        )
+        
+        expected = {
+            "check_name": "Source Cache",
+            "status": "WARNING",
+            "message": "3 tables cached (0.0GB), 1 stale",
+            "details": {"tables": 3, "size_gb": 0.0, "stale": 1},
+        }
+        assert asdict(result) == expected
+        assert result.as_dict() == expected
+        assert json.loads(json.dumps(result.as_dict())) == expected
+        assert json.loads(json.dumps(result.details)) == expected["details"]
+    
+    def test_as_dict_is_a_copy(self):
+        """Mutating the serialised dict leaves the result untouched."""
+        result = HealthCheckResult("Sync Ledger", "OK", "ok", details={"total": 1})
+        
+        result.as_dict()["details"]["total"] = 99
+        
+        assert result.details == {"total": 1}
+    
+    def test_result_without_details(self):
+        """Results without details serialise to None."""
+        result = HealthCheckResult("Sync Ledger", "OK", "No syncs yet")
+        
+        assert json.dumps(result.as_dict())
+        assert result.as_dict()["details"] is None
+
+
+class TestShortError:
+    """Test cases for error message truncation."""
+    
+    def test_string_message_truncated(self):
+        """Plain messages are cut to the limit."""
+        assert _short_error(RuntimeError("x" * 80)) == "x" * 50
+        assert _short_error(RuntimeError("x" * 80), 30) == "x" * 30
+    
+    def test_os_error_keeps_message(self):
+        """OSError reports its message, not the errno in args[0]."""
+        err = PermissionError(13, "Permission denied", "/tmp/manifest.json")
+        
+        assert _short_error(err).startswith("[Errno 13] Permission denied")
+    
+    def test_key_error_and_bare_errors(self):
+        """Non-string args and empty errors still produce a message."""
+        assert _short_error(KeyError("size_bytes")) == "'size_bytes'"
+        assert _short_error(ValueError()) == "ValueError"
+    
+    def test_unreadable_manifest_reports_reason(self, monkeypatch):
+        """A manifest that cannot be opened reports why, not an errno."""
+        from dbt.adapters.icebreaker import health_check
+        
+        with TemporaryDirectory() as tmpdir:
+            manifest = os.path.join(tmpdir, "manifest.json")
+            with open(manifest, "w") as f:
+                f.write("{}")
+            
+            def deny(path):
+                raise PermissionError(13, "Permission denied", path)
+            
+            monkeypatch.setattr(health_check, "_CACHE_MANIFEST", manifest)
+            monkeypatch.setattr(health_check, "_read_manifest", deny)
+            result = HealthChecker()._check_cache()
+        
+        assert result.status == "ERROR"
+        assert result.message.startswith("Cache check failed: [Errno 13] Permission denied")
+
+
+class TestRenderTables:
+    """Test cases for table name sanitising."""
+    
+    def test_plain_names_render(self):
+        """Two-part names render for each dialect."""
+        rendered = _render_tables(["analytics.orders", 'raw."Order Items"'], "snowflake")
+        
+        assert rendered == {
+            "analytics.orders": "analytics.orders",
+            'raw."Order Items"': 'raw."Order Items"',
+        }
+    
+    def test_injection_attempts_rejected(self):
+        """Anything beyond schema.table never reaches the SQL."""
+        names = [
+            "a.b; DROP TABLE x",
+            "a.b UNION SELECT 1",
+            "a.b(1)",
+            "a.b AT(offset => 1)",
+            "db.a.b",
+            "orders",
+        ]
+        
+        assert _render_tables(names, "snowflake") == {}
+        assert _render_tables(names, "duckdb") == {}
+    
+    def test_comments_stripped(self):
+        """Trailing comments are dropped from the rendering."""
+        assert _render_tables(["a.b--x"], "duckdb") == {"a.b--x": "a.b"}
+
+
+class TestDetectDrift:
+    """Test cases for row count drift detection."""
+    
+    def test_drift_with_sanitised_names(self):
+        """Counts are compared per table; invalid names are skipped."""
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "local.duckdb")
+            local = duckdb.connect(path)
+            local.execute("CREATE SCHEMA s")
+            local.execute("CREATE TABLE s.same AS SELECT * FROM range(3)")
+            local.execute("CREATE TABLE s.drifted AS SELECT * FROM range(5)")
+            local.close()
+            
+            cloud_db = duckdb.connect()
+            cloud_db.execute("CREATE SCHEMA s")
+            cloud_db.execute("CREATE TABLE s.same AS SELECT * FROM range(3)")
+            cloud_db.execute("CREATE TABLE s.drifted AS SELECT * FROM range(2)")
+            cloud = _DuckCloud(cloud_db)
+            
+            with HealthChecker(duckdb_path=path, snowflake_conn=cloud) as checker:
+                drift = checker.detect_drift(
+                    ["s.same", "s.drifted", "s.same; DROP TABLE s.same"]
+                )
+            
+            assert [(d.table, d.local_count, d.cloud_count) for d in drift] == [
+                ("s.drifted", 5, 2)
+            ]
+            assert all("DROP" not in sql for sql in cloud.executed)
+            assert cloud_db.execute("SELECT COUNT(*) FROM s.same").fetchone()[0] == 3
@@ -0,0 +1,374 @@
+"""
+Tests for the Icebreaker adapter implementation.
+"""
+
+import threading
+
+import agate
+import duckdb
+from agate.warns import DuplicateColumnWarning
+import pyarrow as pa
+import pytest
+
+from dbt.adapters.icebreaker import impl
+from dbt.adapters.icebreaker.impl import IcebreakerAdapter, _agate_type_for_duckdb
+from dbt.adapters.icebreaker.relation import IcebreakerRelation
+
+
+class _DuckConnections:
+    """Connection manager stand-in that runs everything on an in-memory DuckDB."""
+    
+    def __init__(self):
+        self.conn = duckdb.connect()
+        # Every SQL string sent through execute(), in order; bound reads are not recorded
+        self.sent = []
+        self.reads = 0
+    
+    def set_engine(self, engine):
+        pass
+    
+    def execute(self, sql, auto_begin=False, fetch=False, limit=None):
+        self.sent.append(sql)
+        cursor = self.conn.execute(sql)
+        return "OK", (cursor.fetchall() if fetch else None)
+    
+    def execute_many(self, sqls):
+        response, _ = self.execute(";\n".join(sqls))
+        return response
+    
+    def add_query(self, sql, auto_begin=True, bindings=None):
+        self.reads += 1
+        return None, self.conn.execute(sql, bindings)
+
+
+def _make_adapter() -> IcebreakerAdapter:
+    """Adapter on an in-memory DuckDB: no profile, cloud or warmup thread."""
+    adapter = IcebreakerAdapter.__new__(IcebreakerAdapter)
+    adapter.connections = _DuckConnections()
+    adapter._ddl_state = threading.local()
+    adapter._catalog_cache = {}
+    adapter._schema_exists_cache = {}
+    return adapter
+
+
+def _relation(schema: str, identifier: str = None) -> IcebreakerRelation:
+    return IcebreakerRelation.create(schema=schema, identifier=identifier)
+
+
+class TestResultToAgate:
+    """Test cases for converting query results to agate tables."""
+    
+    def test_arrow_duplicate_column_names(self):
+        """Repeated column names keep every value, in position."""
+        result = pa.Table.from_arrays([pa.array([1]), pa.array([2])], names=["a", "a"])
+        
+        # agate keeps both columns, renaming the second to a_2
+        with pytest.warns(DuplicateColumnWarning):
+            table = _make_adapter()._result_to_agate(result)
+        
+        assert table.column_names == ("a", "a_2")
+        assert [tuple(row) for row in table.rows] == [(1, 2)]
+    
+    def test_arrow_keeps_column_types(self):
+        """Arrow columns map to typed agate columns."""
+        result = pa.table({"n": [1, 2], "name": ["x", "y"], "flag": [True, False]})
+        
+        table = _make_adapter()._result_to_agate(result)
+        
+        assert table.column_names == ("n", "name", "flag")
+        assert [tuple(row) for row in table.rows] == [(1, "x", True), (2, "y", False)]
+    
+    def test_duckdb_description_types(self):
+        """Description types map by base name; arrays and nested types stay text."""
+        expected = {
+            "INTEGER": agate.Number,
+            "DECIMAL(10,2)": agate.Number,
+            "DATE": agate.Date,
+            "TIMESTAMP WITH TIME ZONE": agate.DateTime,
+            "BOOLEAN": agate.Boolean,
+            "VARCHAR": agate.Text,
+            "TIME": agate.Text,
+            "INTEGER[]": agate.Text,
+            "INTEGER[2]": agate.Text,
+            "DECIMAL(10,2)[]": agate.Text,
+            "DATE[]": agate.Text,
+            "STRUCT(x INTEGER)": agate.Text,
+            "MAP(INTEGER, INTEGER)": agate.Text,
+            "UNION(t INTEGER)": agate.Text,
+        }
+        
+        for type_code, agate_type in expected.items():
+            assert type(_agate_type_for_duckdb(type_code)) is agate_type, type_code
+    
+    def test_tuple_rows_with_array_column(self):
+        """A list-typed column no longer fails the Number cast."""
+        description = [("id", "INTEGER"), ("ids", "INTEGER[]")]
+        
+        table = _make_adapter()._result_to_agate([(1, [1, 2])], description)
+        
+        assert table.column_names == ("id", "ids")
+        assert tuple(table.rows[0]) == (1, "[1, 2]")
+
+
+class TestDdlBatch:
+    """Test cases for buffering DDL into one script."""
+    
+    def test_buffers_until_exit_in_order(self):
+        """DDL inside the block is sent once, on exit, in issue order."""
+        adapter = _make_adapter()
+        sent = adapter.connections.sent
+        adapter.connections.conn.execute("CREATE SCHEMA old; CREATE TABLE old.t (id INTEGER)")
+        
+        with adapter.ddl_batch():
+            adapter.create_schema(_relation("analytics"))
+            adapter.rename_relation(_relation("old", "t"), _relation("old", "t2"))
+            adapter.drop_schema(_relation("old"))
+            # Looked up while buffered, so cached before the DDL ran
+            assert not adapter.check_schema_exists(None, "analytics")
+            assert sent == []
+        
+        assert sent == [
+            "CREATE SCHEMA IF NOT EXISTS analytics;\n"
+            'ALTER TABLE "old"."t" RENAME TO t2;\n'
+            "DROP SCHEMA IF EXISTS old CASCADE"
+        ]
+        assert adapter.check_schema_exists(None, "analytics")
+        assert not adapter.check_schema_exists(None, "old")
+    
+    def test_ddl_outside_a_batch_runs_immediately(self):
+        """Without an open batch each DDL statement is executed on its own."""
+        adapter = _make_adapter()
+        
+        adapter.create_schema(_relation("a"))
+        adapter.create_schema(_relation("b"))
+        
+        assert adapter.connections.sent == [
+            "CREATE SCHEMA IF NOT EXISTS a",
+            "CREATE SCHEMA IF NOT EXISTS b",
+        ]
+    
+    def test_nested_batches_join_the_outer_one(self):
+        """An inner window neither opens nor flushes a batch of its own."""
+        adapter = _make_adapter()
+        sent = adapter.connections.sent
+        
+        with adapter.ddl_batch():
+            adapter.create_schema(_relation("a"))
+            with adapter.ddl_batch():
+                adapter.create_schema(_relation("b"))
+            assert sent == []
+            # A materialization running inside the window joins it too
+            assert adapter.begin_ddl_batch() is False
+        
+        assert len(sent) == 1
+        assert adapter.check_schema_exists(None, "a")
+        assert adapter.check_schema_exists(None, "b")
+    
+    def test_begin_and_flush_from_a_materialization(self):
+        """The begin/flush pair used by table.sql behaves like the context manager."""
+        adapter = _make_adapter()
+        sent = adapter.connections.sent
+        
+        assert adapter.begin_ddl_batch() is True
+        adapter.create_schema(_relation("a"))
+        adapter.drop_relation(_relation("a", "t"))
+        assert sent == []
+        adapter.flush_ddl_batch()
+        
+        assert len(sent) == 1
+        # The batch is closed: the next statement runs straight away
+        adapter.create_schema(_relation("b"))
+        assert len(sent) == 2
+    
+    def test_empty_batch_sends_nothing(self):
+        """Closing a batch with nothing buffered makes no round-trip."""
+        adapter = _make_adapter()
+        
+        with adapter.ddl_batch():
+            pass
+        adapter.flush_ddl_batch()
+        
+        assert adapter.connections.sent == []
+    
+    def test_error_in_block_discards_the_batch(self):
+        """If the block raises, buffered DDL is dropped and the batch closed."""
+        adapter = _make_adapter()
+        
+        with pytest.raises(ValueError):
+            with adapter.ddl_batch():
+                adapter.create_schema(_relation("a"))
+                raise ValueError("model failed")
+        
+        assert adapter.connections.sent == []
+        assert not adapter.check_schema_exists(None, "a")
+        assert adapter.begin_ddl_batch() is True
+    
+    def test_failed_flush_closes_the_batch_and_invalidates(self):
+        """A failing script raises, leaves no batch open and drops cached catalog data."""
+        adapter = _make_adapter()
+        
+        with pytest.raises(duckdb.Error):
+            with adapter.ddl_batch():
+                adapter.create_schema(_relation("a"))
+                adapter.rename_relation(_relation("a", "missing"), _relation("a", "t"))
+                assert not adapter.check_schema_exists(None, "a")
+        
+        assert adapter._schema_exists_cache == {}
+        assert adapter.begin_ddl_batch() is True
+
+
+class TestCatalogCache:
+    """Test cases for the cached schema catalog and its invalidation."""
+    
+    @pytest.fixture
+    def adapter(self):
+        adapter = _make_adapter()
+        adapter.connections.conn.execute(
+            "CREATE SCHEMA s; CREATE TABLE s.t (id INTEGER, name VARCHAR)"
+        )
+        return adapter
+    
+    def _column_names(self, adapter, identifier):
+        return [c[0] for c in adapter.get_columns_in_relation(_relation("s", identifier))]
+    
+    def test_one_scan_serves_every_relation(self, adapter):
+        """Column lookups after a listing reuse its catalog scan."""
+        relations = adapter.list_relations_without_caching(_relation("s"))
+        reads = adapter.connections.reads
+        
+        assert [r.identifier for r in relations] == ["t"]
+        assert adapter.get_columns_in_relation(_relation("s", "t")) == [
+            ("id", "INTEGER", "YES", None, None, None),
+            ("name", "VARCHAR", "YES", None, None, None),
+        ]
+        assert adapter.connections.reads == reads
+    
+    def test_replace_through_execute_invalidates(self, adapter):
+        """A CREATE run from a macro drops the cached columns."""
+        assert self._column_names(adapter, "t") == ["id", "name"]
+        
+        adapter.execute("CREATE OR REPLACE TABLE s.t (id INTEGER, name VARCHAR, amount DOUBLE)")
+        
+        assert self._column_names(adapter, "t") == ["id", "name", "amount"]
+    
+    def test_reads_keep_the_cache(self, adapter):
+        """SELECTs cannot change the catalog and leave it cached."""
+        adapter.list_relations_without_caching(_relation("s"))
+        
+        adapter.execute("SELECT * FROM s.t", fetch=True)
+        
+        assert "s" in adapter._catalog_cache
+    
+    def test_drop_relation_invalidates(self, adapter):
+        """A dropped table is no longer reported with its old columns."""
+        assert self._column_names(adapter, "t") == ["id", "name"]
+        
+        adapter.drop_relation(_relation("s", "t"))
+        
+        assert self._column_names(adapter, "t") == []
+    
+    def test_rename_relation_invalidates(self, adapter):
+        """After a rename the columns move to the new name."""
+        assert self._column_names(adapter, "t") == ["id", "name"]
+        
+        adapter.rename_relation(_relation("s", "t"), _relation("s", "t2"))
+        
+        assert self._column_names(adapter, "t") == []
+        assert self._column_names(adapter, "t2") == ["id", "name"]
+    
+    def test_schema_existence_follows_create_and_drop(self, adapter):
+        """Cached schema answers are dropped by create_schema and drop_schema."""
+        assert not adapter.check_schema_exists(None, "new")
+        reads = adapter.connections.reads
+        assert not adapter.check_schema_exists(None, "new")
+        assert adapter.connections.reads == reads
+        
+        adapter.create_schema(_relation("new"))
+        assert adapter.check_schema_exists(None, "new")
+        
+        adapter.drop_schema(_relation("new"))
+        assert not adapter.check_schema_exists(None, "new")
+    
+    def test_execute_model_invalidates_before_and_after(self, adapter):
+        """Lookups cached before or during a model run do not survive it."""
+        adapter.list_relations_without_caching(_relation("s"))
+        seen = []
+        
+        def run(ctx, sql, fetch_results):
+            seen.append(dict(adapter._catalog_cache))
+            # Another thread re-caches the catalog while the model runs
+            adapter.list_relations_without_caching(_relation("s"))
+            raise RuntimeError("model failed")
+        
+        adapter.decide_venue = lambda ctx, sql: "local"
+        adapter._venue_dispatch = {"local": run}
+        
+        with pytest.raises(RuntimeError):
+            adapter.execute_model({"name": "m", "config": {"materialized": "table"}}, None, "")
+        
+        assert seen == [{}]
+        assert adapter._catalog_cache == {}
+
+
+class _FakeRegistrar:
+    """CatalogRegistrar stand-in returning canned refresh results."""
+    
+    def __init__(self, results=None, error=None):
+        self.calls = []
+        self.results = results or {}
+        self.error = error
+    
+    def refresh_tables(self, tables):
+        self.calls.append(list(tables))
+        if self.error is not None:
+            raise self.error
+        return self.results
+
+
+class TestCatalogRefreshDrain:
+    """Test cases for the end-of-run Iceberg catalog refresh."""
+    
+    @pytest.fixture
+    def messages(self, monkeypatch):
+        messages = []
+        monkeypatch.setattr(impl.console, "warn", lambda m: messages.append(("warn", m)))
+        monkeypatch.setattr(impl.console, "debug", lambda m: messages.append(("debug", m)))
+        return messages
+    
+    def _adapter(self, registrar, pending):
+        adapter = _make_adapter()
+        # Shadow the cached_property the way its first access would
+        adapter._catalog_registrar = registrar
+        adapter._pending_refreshes = list(pending)
+        return adapter
+    
+    def test_drains_the_queue_once(self, messages):
+        """Queued tables go to the registrar in one call and the queue empties."""
+        registrar = _FakeRegistrar({"a.t1": True, "a.t2": False})
+        adapter = self._adapter(registrar, [("a", "t1"), ("a", "t2"), ("a", "t1")])
+        
+        adapter._drain_catalog_refreshes()
+        adapter._drain_catalog_refreshes()
+        
+        assert registrar.calls == [[("a", "t1"), ("a", "t2"), ("a", "t1")]]
+        assert adapter._pending_refreshes == []
+        assert messages == [("debug", "Catalog refresh skipped or failed for a.t2")]
+    
+    def test_registrar_error_warns(self, messages):
+        """An exception from the registrar is reported, not raised, at cleanup."""
+        registrar = _FakeRegistrar(error=RuntimeError("catalog down"))
+        adapter = self._adapter(registrar, [("a", "t1")])
+        
+        adapter._drain_catalog_refreshes()
+        
+        assert messages == [("warn", "Catalog refresh failed for 1 table(s): catalog down")]
+        assert adapter._pending_refreshes == []
+    
+    def test_no_registrar_clears_the_queue(self, messages):
+        """Without a configured catalog the queue is dropped silently."""
+        adapter = self._adapter(None, [("a", "t1")])
+        
+        adapter._drain_catalog_refreshes()
+        
+        assert adapter._pending_refreshes == []
+        assert messages == []
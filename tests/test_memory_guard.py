@@ -0,0 +1,98 @@
+"""
+Tests for the Memory Guard's SQL feature extraction.
+"""
+
+import re
+
+import pytest
+
+from dbt.adapters.icebreaker.memory_guard import PreFlightChecker, _extract_features
+
+
+def _string_count_features(sql: str) -> dict:
+    """The guard's original per-feature substring scans, kept as a reference."""
+    sql_upper = sql.upper()
+    limit_match = re.search(r"LIMIT\s+(\d+)", sql_upper)
+    return {
+        "join_count": sql_upper.count(" JOIN "),
+        "window_count": len(re.findall(r"OVER\s*\(", sql_upper)),
+        "select_count": sql_upper.count("SELECT"),
+        "heavy_ops": {kw for kw in ("CUBE", "ROLLUP", "GROUPING SETS") if kw in sql_upper},
+        "has_cross_join": "CROSS JOIN" in sql_upper,
+        "has_filter": any(kw in sql_upper for kw in ("WHERE", "BETWEEN", "DATE", ">", "<")),
+        "limit": int(limit_match.group(1)) if limit_match else None,
+    }
+
+
+def _features_dict(sql: str) -> dict:
+    features = _extract_features(sql)
+    return {
+        "join_count": features.join_count,
+        "window_count": features.window_count,
+        "select_count": features.select_count,
+        "heavy_ops": set(features.heavy_ops),
+        "has_cross_join": features.has_cross_join,
+        "has_filter": features.has_filter,
+        "limit": features.limit,
+    }
+
+
+# Single-spaced SQL, where the original substring counts are exact
+_REFERENCE_QUERIES = [
+    "select 1",
+    "select a from t where b > 1 limit 10",
+    "select a from t cross join u",
+    "select * from a join b on a.id = b.id left join c on c.id = b.id",
+    "select id, row_number() over (partition by g order by ts) from t",
+    "select g, sum(x) from t group by rollup (g)",
+    "select g, sum(x) from t group by grouping sets ((g), ())",
+    "select * from (select * from (select 1) x) y limit 5",
+    "select a, sum(b) over(order by a), avg(b) OVER (partition by a) from t",
+    "select * from t where d between date '2024-01-01' and date '2024-02-01'",
+]
+
+
+class TestExtractFeatures:
+    """Test cases for the single-pass feature scan."""
+    
+    @pytest.mark.parametrize("sql", _REFERENCE_QUERIES)
+    def test_matches_string_count_semantics(self, sql):
+        """Extracted features agree with the original substring scans."""
+        assert _features_dict(sql) == _string_count_features(sql)
+    
+    @pytest.mark.parametrize("sql", [
+        "select a from t cross join\nu",
+        "select a from t\ncross join\n  u",
+        "select a from t CROSS\tJOIN u",
+    ])
+    def test_cross_join_across_whitespace(self, sql):
+        """CROSS JOIN is found whatever whitespace surrounds JOIN."""
+        features = _extract_features(sql)
+        
+        assert features.has_cross_join
+        assert features.join_count == 1
+    
+    def test_join_counted_across_newlines(self):
+        """JOINs at line breaks count, as dbt renders them."""
+        sql = "select *\nfrom a\njoin b on a.id = b.id\nleft join\nc on c.id = a.id"
+        
+        assert _extract_features(sql).join_count == 2
+    
+    def test_identifiers_are_not_keywords(self):
+        """JOIN and SELECT inside identifiers are not counted."""
+        sql = "select joined_at, selected_by, left_join_key from cross_joins"
+        features = _extract_features(sql)
+        
+        assert features.join_count == 0
+        assert features.select_count == 1
+        assert not features.has_cross_join
+
+
+class TestPreFlightChecker:
+    """Test cases for pre-flight warnings."""
+    
+    def test_cross_join_warning_with_newline(self):
+        """The CROSS JOIN warning survives a line break after JOIN."""
+        warnings = PreFlightChecker().check("select a from t cross join\nu", {})
+        
+        assert any("CROSS JOIN" in w.message for w in warnings)
@@ -0,0 +1,202 @@
+"""
+Tests for the Savings Tracker.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from dbt.adapters.icebreaker import savings
+
+
+@pytest.fixture
+def savings_db(tmp_path, monkeypatch):
+    """Point the tracker at a fresh database and reset its process state."""
+    path = str(tmp_path / "savings.db")
+    savings._close_conn()
+    monkeypatch.setattr(savings, "get_db_path", lambda: path)
+    monkeypatch.setattr(savings, "_INITIALIZED", False)
+    monkeypatch.setattr(savings, "_pending", [])
+    yield path
+    savings._close_conn()
+
+
+@pytest.fixture
+def local_tz():
+    """Run with a local timezone away from UTC, so the backfill's conversion shows."""
+    old = os.environ.get("TZ")
+    os.environ["TZ"] = "EST+5EDT,M3.2.0,M11.1.0"
+    time.tzset()
+    yield
+    if old is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = old
+    time.tzset()
+
+
+# The executions table as created before the integer `ts` column existed
+_PRE_TS_SCHEMA = """
+    CREATE TABLE executions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        model_name TEXT NOT NULL,
+        engine_used TEXT NOT NULL,
+        execution_time_seconds REAL,
+        rows_processed INTEGER,
+        bytes_processed INTEGER,
+        estimated_cloud_cost REAL,
+        actual_cost REAL,
+        savings REAL
+    );
+    CREATE INDEX idx_timestamp ON executions(timestamp);
+"""
+
+
+def _make_pre_ts_db(path, stamps):
+    """Write an old-format database holding one local execution per timestamp."""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_PRE_TS_SCHEMA)
+    conn.executemany(
+        "INSERT INTO executions (timestamp, model_name, engine_used, savings) "
+        "VALUES (?, ?, 'duckdb', 1.0)",
+        [(stamp.isoformat(), f"model_{i}") for i, stamp in enumerate(stamps)],
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestBufferedWrites:
+    """Test cases for buffered execution logging."""
+    
+    def test_buffer_flush_read_round_trip(self, savings_db):
+        """Logged executions are buffered, flushed once, then reported."""
+        savings.log_execution("orders", "duckdb", 2.0)
+        savings.log_execution("customers", "duckdb", 3.0)
+        savings.log_execution("big_model", "snowflake", 90.0)
+        
+        assert len(savings._pending) == 3
+        assert not os.path.exists(savings_db)
+        
+        assert savings.flush_pending() == 3
+        assert savings._pending == []
+        assert savings.flush_pending() == 0
+        
+        summary = savings.get_savings_summary("today")
+        assert summary["total_queries"] == 3
+        assert summary["local_queries"] == 2
+        assert summary["cloud_queries"] == 1
+        assert summary["total_savings"] > 0
+        assert {m["model"] for m in summary["top_models"]} == {"orders", "customers"}
+    
+    def test_reads_flush_the_buffer(self, savings_db):
+        """Reports include executions not yet flushed explicitly."""
+        savings.log_execution("orders", "duckdb", 2.0)
+        
+        assert savings.get_savings_summary("all")["total_queries"] == 1
+        assert savings._pending == []
+    
+    def test_failed_flush_keeps_records(self, savings_db, monkeypatch):
+        """A failed write leaves the records buffered, in order, for the next flush."""
+        savings.log_execution("first", "duckdb", 1.0)
+        savings.log_execution("second", "duckdb", 1.0)
+        
+        good_sql = savings._INSERT_EXECUTION_SQL
+        monkeypatch.setattr(
+            savings, "_INSERT_EXECUTION_SQL", "INSERT INTO no_such_table VALUES (?)"
+        )
+        assert savings.flush_pending() == 0
+        assert [e.model_name for e in savings._pending] == ["first", "second"]
+        
+        savings.log_execution("third", "duckdb", 1.0)
+        monkeypatch.setattr(savings, "_INSERT_EXECUTION_SQL", good_sql)
+        assert savings.flush_pending() == 3
+        
+        rows = savings._get_conn().execute(
+            "SELECT model_name FROM executions ORDER BY id"
+        ).fetchall()
+        assert [r[0] for r in rows] == ["first", "second", "third"]
+
+
+class TestTsMigration:
+    """Test cases for upgrading databases that predate the `ts` column."""
+    
+    def test_backfills_local_timestamps_as_epochs(self, savings_db, local_tz):
+        """Naive local timestamps become the matching UTC epoch microseconds."""
+        stamps = [
+            datetime(2024, 1, 15, 9, 30, 0),
+            datetime(2024, 7, 4, 23, 59, 59, 250000),
+            datetime.now(),
+        ]
+        _make_pre_ts_db(savings_db, stamps)
+        
+        savings._ensure_init()
+        
+        conn = savings._get_conn()
+        rows = conn.execute("SELECT ts FROM executions ORDER BY id").fetchall()
+        # strftime('%s') keeps whole seconds
+        assert [r[0] for r in rows] == [
+            int(stamp.replace(microsecond=0).timestamp()) * 1_000_000 for stamp in stamps
+        ]
+        indexes = {r[1] for r in conn.execute("PRAGMA index_list(executions)")}
+        assert "idx_ts" in indexes
+        assert "idx_timestamp" not in indexes
+    
+    def test_period_cutoffs_after_migration(self, savings_db, local_tz):
+        """Migrated rows and new rows fall into the right report periods."""
+        now = datetime.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        _make_pre_ts_db(savings_db, [
+            midnight + (now - midnight) / 2,
+            now - timedelta(days=3),
+            now - timedelta(days=10),
+            now - timedelta(days=40),
+        ])
+        
+        assert savings._period_cutoff("today") == int(midnight.timestamp()) * 1_000_000
+        assert savings._period_cutoff("all") == 0
+        
+        counts = {
+            period: savings.get_savings_summary(period)["total_queries"]
+            for period in ("today", "week", "month", "all")
+        }
+        assert counts == {"today": 1, "week": 2, "month": 3, "all": 4}
+        
+        savings.log_execution("fresh", "duckdb", 1.0)
+        assert savings.get_savings_summary("today")["total_queries"] == 2
+    
+    def test_concurrent_migration(self, savings_db):
+        """A process that finds `ts` missing, then loses the race, does not fail."""
+        _make_pre_ts_db(savings_db, [datetime(2024, 1, 15, 9, 30, 0)])
+        
+        # Another process is partway through migrating the same database
+        other = sqlite3.connect(savings_db, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        other.execute("ALTER TABLE executions ADD COLUMN ts INTEGER")
+        other.execute("UPDATE executions SET ts = 42")
+        
+        errors = []
+        
+        def migrate():
+            try:
+                savings._ensure_init()
+            except Exception as e:
+                errors.append(e)
+        
+        thread = threading.Thread(target=migrate)
+        thread.start()
+        time.sleep(0.2)
+        other.execute("COMMIT")
+        other.close()
+        thread.join(timeout=10)
+        
+        assert not thread.is_alive()
+        assert errors == []
+        assert savings._INITIALIZED
+        rows = savings._get_conn().execute("SELECT ts FROM executions").fetchall()
+        assert rows == [(42,)]
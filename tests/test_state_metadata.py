@@ -2,10 +2,13 @@
 Tests for State Manager and Metadata Harvester.
 """
 
+import dataclasses
 import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+
 from dbt.adapters.icebreaker.state import StateManager, StateConfig
 from dbt.adapters.icebreaker.metadata import MetadataHarvester, MetadataConfig, ModelStats
 
@@ -139,6 +142,20 @@ class TestMetadataHarvester:
             assert retrieved is not None
             assert retrieved.avg_seconds == 120.0
     
+    def test_shared_stats_cannot_be_mutated(self):
+        """One caller cannot change the stats every later caller sees."""
+        with TemporaryDirectory() as tmpdir:
+            config = MetadataConfig(state_dir=Path(tmpdir))
+            harvester = MetadataHarvester(config)
+            harvester._cache = {"models": {"model_a": {"avg_seconds": 120.0}}}
+            
+            stats = harvester.get_model_stats("model_a")
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                stats.avg_seconds = 0.0
+            
+            assert harvester.get_model_stats("model_a").avg_seconds == 120.0
+            assert harvester.get_all_stats()["model_a"].avg_seconds == 120.0
+    
     def test_get_slow_models(self):
         """Should identify slow models."""
         with TemporaryDirectory() as tmpdir:
@@ -79,6 +79,17 @@ class TestTranspilerEdgeCases:
         assert "1" in result
         assert "2" in result
     
+    def test_repeated_sql_is_memoized(self):
+        """Identical SQL should be served from the cache on repeat calls."""
+        sql = "SELECT NVL(a, 0) AS a FROM t"
+        transpiler = Transpiler()
+        
+        first = transpiler.to_duckdb(sql)
+        second = transpiler.to_duckdb(sql)
+        
+        assert first == second
+        assert transpiler._transpile_cached.cache_info().hits == 1
+    
     def test_invalid_target_dialect(self):
         """Non-duckdb target should raise error."""
         with pytest.raises(ValueError):